@@ -1,2 +1,3 @@
-from .websites import rss_websites
-from .websites import rss_functions
\ No newline at end of file
+from .websites import rss_websites, feed_config, get_rss_handler, build_feed_jobs
+from .ingestion import ingest_feeds, format_ingestion_report
+from .scheduler import run_scheduler
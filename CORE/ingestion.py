@@ -0,0 +1,152 @@
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from urllib.parse import urlparse
+
+from proxy.oxylab import proxy_content, NOT_MODIFIED
+from proxy.validators import forget_validators
+
+# Concurrency limits (overridable through the environment)
+MAX_IN_FLIGHT = int(os.getenv("RSS_MAX_IN_FLIGHT", 8))  # Global cap on feeds fetched at once
+MAX_PER_HOST = int(os.getenv("RSS_MAX_PER_HOST", 2))  # Cap on concurrent fetches against one host
+FEED_TIMEOUT = float(os.getenv("RSS_FEED_TIMEOUT", 30))  # Seconds allowed per feed fetch
+
+logger = logging.getLogger(__name__)
+
+
+def _host_of(url: str) -> str:
+    return urlparse(url).netloc.lower()
+
+
+def _interleave_by_host(jobs):
+    """Round-robin jobs across hosts so one busy host cannot hold every worker"""
+    by_host = OrderedDict()
+    for job in jobs:
+        by_host.setdefault(_host_of(job["url"]), []).append(job)
+
+    ordered = []
+    while by_host:
+        for host in list(by_host):
+            ordered.append(by_host[host].pop(0))
+            if not by_host[host]:
+                del by_host[host]
+    return ordered
+
+
+def _run_feed(job, host_limits, feed_timeout, started):
+    """Fetch and process a single feed, returning its timing entry for the report"""
+    name = job["name"]
+    host = _host_of(job["url"])
+    entry = {
+        "feed": name,
+        "host": host,
+        "status": "ok",
+        "fetch_seconds": 0.0,
+        "process_seconds": 0.0,
+        "wall_seconds": 0.0,
+        "error": None,
+    }
+
+    wall_start = time.monotonic()
+    with host_limits[host]:
+        started[name] = time.monotonic()
+        fetch_start = time.monotonic()
+        # No retries: the watchdog bounds a feed by feed_timeout, and retry backoff would hold
+        # this worker and the host's slot for several timeouts
+        content = proxy_content(job["url"], timeout=feed_timeout, conditional=True, retry=False)
+        entry["fetch_seconds"] = time.monotonic() - fetch_start
+
+    if content is None:
+        entry["status"] = "fetch_failed"
+    elif content is NOT_MODIFIED:
+        # Feed unchanged since the last poll, nothing to parse
+        entry["status"] = "not_modified"
+    else:
+        # A body that arrived late is still processed: its validators are already stored, so
+        # dropping it would get the next poll a 304 and lose these items
+        if entry["fetch_seconds"] > feed_timeout:
+            entry["status"] = "slow"
+        process_start = time.monotonic()
+        try:
+            job["handler"](content, *job.get("args", ()))
+        except Exception as e:
+            entry["status"] = "error"
+            entry["error"] = str(e)
+            logger.error(f"Error processing {name}: {e}")
+            # Items were not stored, so the next poll must not be answered with a 304
+            forget_validators(job["url"])
+        entry["process_seconds"] = time.monotonic() - process_start
+
+    entry["wall_seconds"] = time.monotonic() - wall_start
+    return entry
+
+
+def ingest_feeds(jobs, max_in_flight: int = MAX_IN_FLIGHT, max_per_host: int = MAX_PER_HOST,
+                 feed_timeout: float = FEED_TIMEOUT):
+    """
+    Fetch and process RSS feeds concurrently.
+
+    Each job is a dict with "name", "url", "handler" and optional "args"; the handler is
+    called as handler(content, *args) once the feed body is downloaded. Returns one report
+    entry per feed with its status and wall time.
+    """
+    jobs = _interleave_by_host(list(jobs))
+    if not jobs:
+        return []
+
+    host_limits = {host: threading.BoundedSemaphore(max_per_host) for host in {_host_of(j["url"]) for j in jobs}}
+    started = {}
+    report = []
+
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_in_flight, len(jobs))), thread_name_prefix="rss")
+    try:
+        pending = {executor.submit(_run_feed, job, host_limits, feed_timeout, started): job for job in jobs}
+        while pending:
+            done, _ = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+            for future in done:
+                report.append(future.result())
+                del pending[future]
+
+            # Stop waiting on feeds well past their fetch budget; their threads finish in the background
+            now = time.monotonic()
+            for future, job in list(pending.items()):
+                start = started.get(job["name"])
+                if start is not None and now - start > feed_timeout * 2:
+                    logger.warning(f"Feed {job['name']} exceeded {feed_timeout}s, not waiting for it")
+                    # Its items may never be stored, so the next poll must refetch the full body
+                    forget_validators(job["url"])
+                    report.append({
+                        "feed": job["name"],
+                        "host": _host_of(job["url"]),
+                        "status": "timeout",
+                        "fetch_seconds": now - start,
+                        "process_seconds": 0.0,
+                        "wall_seconds": now - start,
+                        "error": f"exceeded {feed_timeout}s",
+                    })
+                    del pending[future]
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return report
+
+
+def format_ingestion_report(report, total_seconds: float = None) -> str:
+    lines = [
+        f"{'Feed':<32} {'Status':<13} {'Fetch(s)':>9} {'Process(s)':>11} {'Wall(s)':>8}",
+        "-" * 77,
+    ]
+    for entry in sorted(report, key=lambda e: e["wall_seconds"], reverse=True):
+        lines.append(
+            f"{entry['feed']:<32} {entry['status']:<13} {entry['fetch_seconds']:>9.2f} "
+            f"{entry['process_seconds']:>11.2f} {entry['wall_seconds']:>8.2f}"
+        )
+    if report:
+        slowest = max(entry["wall_seconds"] for entry in report)
+        lines.append("-" * 77)
+        lines.append(f"Feeds: {len(report)}, slowest feed: {slowest:.2f}s"
+                     + (f", total pass: {total_seconds:.2f}s" if total_seconds is not None else ""))
+    return "\n".join(lines)
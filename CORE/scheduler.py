@@ -0,0 +1,113 @@
+import csv
+import logging
+import os
+import time
+from collections import deque
+from datetime import datetime
+
+from .ingestion import ingest_feeds, format_ingestion_report
+from .websites import build_feed_jobs, get_source, rss_websites
+
+# Polling bounds in seconds (overridable through the environment)
+MIN_INTERVAL = float(os.getenv("RSS_MIN_INTERVAL", 120))
+MAX_INTERVAL = float(os.getenv("RSS_MAX_INTERVAL", 3600))
+DEFAULT_INTERVAL = float(os.getenv("RSS_DEFAULT_INTERVAL", 600))
+MAX_ERROR_BACKOFF = float(os.getenv("RSS_MAX_ERROR_BACKOFF", 4 * 3600))
+TARGET_NEW_PER_POLL = float(os.getenv("RSS_TARGET_NEW_PER_POLL", 3))  # Poll about when this many items are due
+HISTORY_ROWS = 20  # Rows of log/<feed>.csv used to estimate a feed's publish rate
+IDLE_SLEEP = 30  # Longest the loop sleeps before re-checking due feeds
+
+FAILED_STATUSES = {"fetch_failed", "error", "timeout"}
+
+logger = logging.getLogger(__name__)
+
+
+def feed_rate(csv_file: str, now: float = None):
+    """
+    New items per second observed in the last HISTORY_ROWS rows written by log_statistics.
+
+    The window runs up to now, so polls answered with 304 (which write no row) still count
+    as quiet time. Returns None when there is not enough history to estimate a rate.
+    """
+    try:
+        with open(csv_file, "r", encoding="utf-8") as f:
+            rows = deque(csv.DictReader(f), maxlen=HISTORY_ROWS)
+    except FileNotFoundError:
+        return None
+    if len(rows) < 2:
+        return None
+
+    try:
+        first_seen = datetime.strptime(rows[0]["Timestamp"], "%Y-%m-%d %H:%M:%S").timestamp()
+        # The first row's items were published before the window opened
+        new_items = sum(int(row["New Titles"]) for row in list(rows)[1:])
+    except (KeyError, ValueError):
+        return None
+
+    window = (now or time.time()) - first_seen
+    if window <= 0:
+        return None
+    return new_items / window
+
+
+def poll_interval(rate) -> float:
+    if rate is None:
+        return DEFAULT_INTERVAL
+    if rate <= 0:
+        return MAX_INTERVAL
+    return min(MAX_INTERVAL, max(MIN_INTERVAL, TARGET_NEW_PER_POLL / rate))
+
+
+def _csv_file(name: str) -> str:
+    full_name, _, _ = get_source(name)
+    return os.path.join("log", f"{full_name}.csv")
+
+
+def run_scheduler(names=None, max_cycles: int = None):
+    """
+    Poll feeds forever (or for max_cycles rounds), each on its own learned interval.
+
+    Busy feeds are polled close to MIN_INTERVAL, quiet ones drift towards MAX_INTERVAL and
+    feeds that fail back off exponentially up to MAX_ERROR_BACKOFF.
+    """
+    names = list(names if names is not None else rss_websites)
+    if not names:
+        return
+    now = time.time()
+    state = {name: {"next_due": now, "errors": 0, "interval": DEFAULT_INTERVAL} for name in names}
+    cycles = 0
+
+    while max_cycles is None or cycles < max_cycles:
+        now = time.time()
+        due = [name for name, feed in state.items() if feed["next_due"] <= now]
+
+        if due:
+            cycles += 1
+            report = ingest_feeds(build_feed_jobs(due))
+            print(format_ingestion_report(report))
+
+            now = time.time()
+            for entry in report:
+                feed = state[entry["feed"]]
+                if entry["status"] in FAILED_STATUSES:
+                    feed["errors"] += 1
+                    feed["interval"] = min(MAX_ERROR_BACKOFF, poll_interval(None) * 2 ** feed["errors"])
+                else:
+                    feed["errors"] = 0
+                    feed["interval"] = poll_interval(feed_rate(_csv_file(entry["feed"]), now))
+                feed["next_due"] = now + feed["interval"]
+                logger.info(f"{entry['feed']}: {entry['status']}, next poll in {feed['interval']:.0f}s")
+
+        if max_cycles is not None and cycles >= max_cycles:
+            break
+
+        next_due = min(feed["next_due"] for feed in state.values())
+        time.sleep(min(IDLE_SLEEP, max(0.0, next_due - time.time())))
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    try:
+        run_scheduler()
+    except KeyboardInterrupt:
+        print("keyboard interrupt \n scheduler stopped")
@@ -4,6 +4,21 @@ from dotenv import load_dotenv
 
 load_dotenv()
 DATABASE_URL = os.getenv("DATABASE_URL")
+VECTOR_INDEX_TYPE = os.getenv("VECTOR_INDEX_TYPE", "hnsw").lower()  # "hnsw" or "ivfflat"
+IVFFLAT_LISTS = int(os.getenv("IVFFLAT_LISTS", 100))
+
+VECTOR_INDEX_SQL = {
+    "hnsw": """
+        CREATE INDEX IF NOT EXISTS VECTORS_TABLE_EMBEDDINGS_IDX
+        ON VECTORS_TABLE USING hnsw (EMBEDDINGS vector_cosine_ops)
+        WITH (m = 16, ef_construction = 64);
+    """,
+    "ivfflat": f"""
+        CREATE INDEX IF NOT EXISTS VECTORS_TABLE_EMBEDDINGS_IDX
+        ON VECTORS_TABLE USING ivfflat (EMBEDDINGS vector_cosine_ops)
+        WITH (lists = {IVFFLAT_LISTS});
+    """,
+}
 
 
 def build_DB():
@@ -80,6 +95,15 @@ def build_DB():
                 print("❌ Error creating VECTORS_TABLE:", e)
                 conn.rollback()
 
+            # Cosine ANN index on VECTORS_TABLE.EMBEDDINGS (used by fetch.nearest_neighbours)
+            try:
+                cursor.execute(VECTOR_INDEX_SQL[VECTOR_INDEX_TYPE])
+                conn.commit()
+                print(f"✅ VECTORS_TABLE {VECTOR_INDEX_TYPE} index created")
+            except Exception as e:
+                print(f"❌ Error creating VECTORS_TABLE {VECTOR_INDEX_TYPE} index:", e)
+                conn.rollback()
+
             # Create CATEGORY_TABLE
             try:
                 cursor.execute(
@@ -1,7 +1,8 @@
-import psycopg2
 import os
+import numpy as np
 from dotenv import load_dotenv
 from .getDatabase import wait_for_connection
+from .vector_codec import fetch_vector_matrix
 from urllib.parse import urlparse
 import re 
 
@@ -111,32 +112,6 @@ def get_primary_article_id_by_url(url):
         conn.close()
 
 
-def get_all_rss_embeddings():
-    """
-    Fetch all article_id, embedding pairs for non-Google RSS articles.
-    """
-    try:
-        conn = psycopg2.connect(DATABASE_URL)
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            SELECT ARTICLE_ID, EMBEDDINGS
-            FROM VECTORS_TABLE
-            WHERE METADATA NOT LIKE '%google%'
-            """
-        )
-        results = cursor.fetchall()
-        return results
-    except Exception as e:
-        print(f"Error fetching RSS embeddings: {e}")
-        return []
-    finally:
-        if cursor:
-            cursor.close()
-        if conn:
-            conn.close()
-
-
 def get_keywords_by_article_id(article_id: str):
     """
     Fetch top 20 keywords for a given article ID.
@@ -157,3 +132,80 @@ def get_keywords_by_article_id(article_id: str):
         return [row[0] for row in results] if results else []
     finally:
         conn.close()
+
+
+def get_all_vectors():
+    """
+    Fetch every (ARTICLE_ID, EMBEDDINGS, METADATA) row of VECTORS_TABLE. The embeddings are
+    rows of one float32 matrix read with binary COPY.
+    """
+    conn = wait_for_connection()
+    try:
+        with conn.cursor() as cursor:
+            article_ids, metadata, matrix = fetch_vector_matrix(cursor)
+        return list(zip(article_ids, matrix, metadata))
+    finally:
+        conn.close()
+
+
+def get_vector_ids():
+    """ARTICLE_ID of every row of VECTORS_TABLE, as strings"""
+    conn = wait_for_connection()
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT ARTICLE_ID FROM VECTORS_TABLE")
+            return [str(row[0]) for row in cursor.fetchall()]
+    finally:
+        conn.close()
+
+
+def get_vectors_by_ids(article_ids):
+    """
+    (ARTICLE_ID, EMBEDDINGS, METADATA) rows of VECTORS_TABLE for the given ids, read with
+    binary COPY like get_all_vectors.
+    """
+    if not article_ids:
+        return []
+    conn = wait_for_connection()
+    try:
+        with conn.cursor() as cursor:
+            ids, metadata, matrix = fetch_vector_matrix(
+                cursor, "WHERE ARTICLE_ID = ANY(%s::uuid[])", (list(article_ids),)
+            )
+        return list(zip(ids, matrix, metadata))
+    finally:
+        conn.close()
+
+
+def nearest_neighbours(embedding, exclude_url=None, k=10, threshold=None):
+    """
+    Up to k (ARTICLE_ID, cosine_score) pairs closest to embedding, best first, found by the
+    VECTORS_TABLE cosine index. The article at exclude_url is skipped and, when threshold is
+    given, only scores above it are returned. The embedding is sent as a float32 array
+    (see vector_codec.register_vector).
+    """
+    query = """
+        SELECT ARTICLE_ID, 1 - distance AS score FROM (
+            SELECT ARTICLE_ID, EMBEDDINGS <=> %(embedding)s AS distance
+            FROM VECTORS_TABLE
+            WHERE METADATA IS DISTINCT FROM %(exclude_url)s
+            ORDER BY distance
+            LIMIT %(k)s
+        ) AS nearest
+        WHERE %(max_distance)s IS NULL OR distance < %(max_distance)s
+        ORDER BY distance
+    """
+    params = {
+        "embedding": np.asarray(embedding, dtype=np.float32).reshape(-1),
+        "exclude_url": exclude_url,
+        "k": k,
+        "max_distance": None if threshold is None else 1 - threshold,
+    }
+
+    conn = wait_for_connection()
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute(query, params)
+            return [(str(article_id), float(score)) for article_id, score in cursor.fetchall()]
+    finally:
+        conn.close()
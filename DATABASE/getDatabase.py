@@ -3,6 +3,7 @@ import time
 import os
 from psycopg2 import OperationalError, Error
 from dotenv import load_dotenv
+from .vector_codec import register_vector
 
 load_dotenv()
 
@@ -15,7 +16,9 @@ DB_CONN_TIMEOUT = int(os.getenv("DB_CONN_TIMEOUT", 10))  # Optional timeout (in
 def get_connection():
     try:
         print("🔌 Attempting to connect to the database...")
-        return psycopg2.connect(DATABASE_URL, connect_timeout=DB_CONN_TIMEOUT)
+        conn = psycopg2.connect(DATABASE_URL, connect_timeout=DB_CONN_TIMEOUT)
+        register_vector(conn)
+        return conn
     except (OperationalError, Error) as e:
         print(f"❌ Connection attempt failed: {e}")
         return None
@@ -2,8 +2,8 @@ import psycopg2
 import os
 from dotenv import load_dotenv
 from .getDatabase import wait_for_connection
+from .vector_codec import copy_vectors_in
 import uuid
-import numpy as np
 from datetime import datetime, date
 
 load_dotenv()
@@ -155,16 +155,7 @@ def insertVECTORSTable(ARTICLE_ID, EMBEDDINGS, METADATA):
             return False
 
         with conn.cursor() as cursor:
-            cursor.execute(
-                """
-                INSERT INTO VECTORS_TABLE (
-                    ARTICLE_ID,
-                    EMBEDDINGS,
-                    METADATA
-                ) VALUES (%s, %s, %s)
-                """,
-                (ARTICLE_ID, EMBEDDINGS, METADATA),
-            )
+            copy_vectors_in(cursor, [(ARTICLE_ID, EMBEDDINGS, METADATA)])
         conn.commit()
         return True
 
@@ -302,13 +293,6 @@ def insertUniqueNewsInDB(news, vector_embeddings, article_category, FULL_NEWS):
 
         primary_article_id = str(uuid.uuid4())
 
-        # Convert embeddings to list of float32
-        embedding_list = (
-            vector_embeddings.astype(np.float32).tolist()
-            if isinstance(vector_embeddings, np.ndarray)
-            else np.array(vector_embeddings, dtype=np.float32).tolist()
-        )
-
         with conn:
             with conn.cursor() as cursor:
                 # PRIMARY_TABLE insert
@@ -349,13 +333,9 @@ def insertUniqueNewsInDB(news, vector_embeddings, article_category, FULL_NEWS):
                     ),
                 )
 
-                # VECTORS_TABLE insert
-                cursor.execute(
-                    """
-                    INSERT INTO VECTORS_TABLE (ARTICLE_ID, EMBEDDINGS, METADATA)
-                    VALUES (%s, %s, %s)
-                    """,
-                    (primary_article_id, embedding_list, news["link"]),
+                # VECTORS_TABLE insert (binary pgvector through COPY)
+                copy_vectors_in(
+                    cursor, [(primary_article_id, vector_embeddings, news["link"])]
                 )
 
                 # FULL_NEWS_TABLE insert
@@ -424,12 +404,6 @@ def insertDuplicateNewsInDB(
 
         article_id = str(uuid.uuid4())
 
-        # Convert embeddings to proper format
-        if isinstance(vector_embeddings, np.ndarray):
-            embedding_str = vector_embeddings.astype(np.float32).tolist()
-        else:
-            embedding_str = np.array(vector_embeddings, dtype=np.float32).tolist()
-
         # Use transaction for all operations
         with conn:
             with conn.cursor() as cursor:
@@ -0,0 +1,138 @@
+import io
+import struct
+import uuid
+
+import numpy as np
+import psycopg2
+import psycopg2.extensions
+
+# pgvector <-> numpy without going through Python float lists. Query results holding a vector
+# column are decoded straight into float32 arrays by a registered typecaster, numpy arrays
+# passed as query parameters are sent as vector values by a registered adapter, bulk reads of
+# VECTORS_TABLE use binary COPY into one contiguous matrix, and inserts send the binary
+# vector format (uint16 dim, uint16 unused, big-endian float32 values) through binary COPY.
+COPY_SIGNATURE = b"PGCOPY\n\xff\r\n\x00"
+COPY_HEADER = COPY_SIGNATURE + struct.pack(">ii", 0, 0)
+COPY_TRAILER = struct.pack(">h", -1)
+
+_vector_type = None
+
+
+def _cast_vector(value, cursor):
+    if value is None:
+        return None
+    return np.fromstring(value[1:-1], dtype=np.float32, sep=",")
+
+
+def _adapt_vector(array):
+    values = np.asarray(array, dtype=np.float32).reshape(-1)
+    return psycopg2.extensions.AsIs("'[" + ",".join(values.astype(str)) + "]'::vector")
+
+
+def register_vector(conn) -> bool:
+    """
+    Decode pgvector columns to float32 numpy arrays, and send numpy array parameters as
+    vectors, for every connection (once per process)
+    """
+    global _vector_type
+    if _vector_type is not None:
+        return True
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT to_regtype('vector')::oid")
+            oid = cursor.fetchone()[0]
+        conn.rollback()
+    except psycopg2.Error:
+        conn.rollback()
+        return False
+    if not oid:
+        return False
+    _vector_type = psycopg2.extensions.new_type((oid,), "VECTOR", _cast_vector)
+    psycopg2.extensions.register_type(_vector_type)
+    # This connection was opened before the caster existed
+    psycopg2.extensions.register_type(_vector_type, conn)
+    psycopg2.extensions.register_adapter(np.ndarray, _adapt_vector)
+    return True
+
+
+def encode_vector(embedding) -> bytes:
+    """pgvector binary representation of an embedding"""
+    values = np.asarray(embedding, dtype=">f4").reshape(-1)
+    return struct.pack(">HH", values.size, 0) + values.tobytes()
+
+
+def decode_vector(data: bytes) -> np.ndarray:
+    dim, _ = struct.unpack_from(">HH", data)
+    return np.frombuffer(data, dtype=">f4", count=dim, offset=4).astype(np.float32)
+
+
+def copy_vectors_in(cursor, rows) -> int:
+    """Insert (article_id, embedding, metadata) rows into VECTORS_TABLE with binary COPY"""
+    buffer = io.BytesIO()
+    buffer.write(COPY_HEADER)
+    count = 0
+    for article_id, embedding, metadata in rows:
+        article_bytes = uuid.UUID(str(article_id)).bytes
+        vector_bytes = encode_vector(embedding)
+        metadata_bytes = metadata.encode("utf-8")
+        buffer.write(struct.pack(">h", 3))
+        for field in (article_bytes, vector_bytes, metadata_bytes):
+            buffer.write(struct.pack(">i", len(field)))
+            buffer.write(field)
+        count += 1
+    buffer.write(COPY_TRAILER)
+    buffer.seek(0)
+    cursor.copy_expert(
+        "COPY VECTORS_TABLE (ARTICLE_ID, EMBEDDINGS, METADATA) FROM STDIN WITH (FORMAT BINARY)",
+        buffer,
+    )
+    return count
+
+
+def _copy_fields(data: bytes):
+    """Yield each tuple of a binary COPY stream as a list of raw field bytes (None for NULL)"""
+    if not data.startswith(COPY_SIGNATURE):
+        raise ValueError("not a binary COPY stream")
+    (extension_len,) = struct.unpack_from(">i", data, len(COPY_SIGNATURE) + 4)
+    offset = len(COPY_HEADER) + extension_len
+    while True:
+        (field_count,) = struct.unpack_from(">h", data, offset)
+        offset += 2
+        if field_count == -1:
+            return
+        fields = []
+        for _ in range(field_count):
+            (length,) = struct.unpack_from(">i", data, offset)
+            offset += 4
+            if length == -1:
+                fields.append(None)
+                continue
+            fields.append(data[offset:offset + length])
+            offset += length
+        yield fields
+
+
+def fetch_vector_matrix(cursor, where: str = "", params=None):
+    """
+    (article_ids, metadata, matrix) for the VECTORS_TABLE rows matching where, with every
+    embedding decoded into one contiguous (N, dim) float32 matrix via binary COPY.
+    """
+    select = f"SELECT ARTICLE_ID, METADATA, EMBEDDINGS FROM VECTORS_TABLE {where}"
+    if params:
+        select = cursor.mogrify(select, params).decode("utf-8")
+    buffer = io.BytesIO()
+    cursor.copy_expert(f"COPY ({select}) TO STDOUT WITH (FORMAT BINARY)", buffer)
+
+    article_ids, metadata, vectors = [], [], []
+    for article_bytes, metadata_bytes, vector_bytes in _copy_fields(buffer.getvalue()):
+        article_ids.append(str(uuid.UUID(bytes=article_bytes)))
+        metadata.append(metadata_bytes.decode("utf-8") if metadata_bytes is not None else None)
+        vectors.append(vector_bytes)
+
+    if not vectors:
+        return article_ids, metadata, np.empty((0, 0), dtype=np.float32)
+    dim = struct.unpack_from(">H", vectors[0])[0]
+    # All rows share the column's dimension, so the value bytes can be decoded in one go
+    values = b"".join(vector[4:] for vector in vectors)
+    matrix = np.frombuffer(values, dtype=">f4").reshape(len(vectors), dim).astype(np.float32)
+    return article_ids, metadata, matrix
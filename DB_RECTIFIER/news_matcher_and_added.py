@@ -1,6 +1,6 @@
 from .llm_response import llm_true_false
-from HELPER.embeddings import NOMIC_EMBEDDINGS
-from DATABASE.fetch import if_unique_data, HideFilteredResults
+from HELPER.embeddings import NOMIC_EMBEDDINGS, EMBED_BATCH_SIZE
+from DATABASE.fetch import if_unique_data, nearest_neighbours
 from DATABASE.insert import (
     insertPrimaryTable,
     insertSecondTable,
@@ -8,23 +8,51 @@ from DATABASE.insert import (
     insertUniqueNewsInDB,
     insertDuplicateNewsInDB,
 )
-from HELPER.check_similarity import check_cosine_similarity
+from HELPER.check_similarity import match_neighbours, SOMEWHAT_SIMILAR_THRESHOLD
 import uuid
 import os
 
+# "faiss": local HNSW index (HELPER.vector_index); "pgvector": cosine index inside Postgres
+SIMILARITY_BACKEND = os.getenv("SIMILARITY_BACKEND", "faiss").lower()
+NEIGHBOURS_K = int(os.getenv("NEWS_INDEX_TOP_K", 10))
+
+if SIMILARITY_BACKEND == "faiss":
+    from HELPER.vector_index import search, add_vector
+
 
 nomic = NOMIC_EMBEDDINGS()
 import json
 
 
-def NEWS_SCORE(news):
+def find_neighbours(vector_embeddings, news_url):
+    """(article_id, cosine_score) pairs for the stored articles closest to vector_embeddings"""
+    if SIMILARITY_BACKEND == "pgvector":
+        return nearest_neighbours(
+            vector_embeddings,
+            exclude_url=news_url,
+            k=NEIGHBOURS_K,
+            threshold=SOMEWHAT_SIMILAR_THRESHOLD,
+        )
+    return search(vector_embeddings, k=NEIGHBOURS_K, exclude_url=news_url)
+
+
+def news_text(news):
+    """Text that is embedded for similarity matching"""
+    return str(news["title"] + ", details :" + news["description"])
+
+
+def embed_news(news_items, batch_size=EMBED_BATCH_SIZE):
+    """(N, 768) embeddings for many articles, encoded in batches"""
+    return nomic.embed_text([news_text(news) for news in news_items], batch_size=batch_size)
+
+
+def NEWS_SCORE(news, vector_embeddings=None):
     news_url = news["link"]
-    news_short = str(news["title"] + ", details :" + news["description"])
-    vector_embeddings = nomic.embed_text(news_short)
-    Filter_results = HideFilteredResults("VECTORS_TABLE", "METADATA", news_url)
-    similar_news_id, somewhat_similar_news_id = check_cosine_similarity(
-        vector_embeddings, Filter_results
-    )
+    if vector_embeddings is None:
+        vector_embeddings = nomic.embed_text([news_text(news)])[0]
+    # Top-k neighbours from an ANN index instead of every row of VECTORS_TABLE
+    neighbours = find_neighbours(vector_embeddings, news_url)
+    similar_news_id, somewhat_similar_news_id = match_neighbours(neighbours)
     return similar_news_id, somewhat_similar_news_id, vector_embeddings
 
 
@@ -39,9 +67,11 @@ def add_news_in_db(
 
     # unique news
     if similar_news_id == None and somewhat_similar_news_id == None:
-        insertUniqueNewsInDB(
+        article_id = insertUniqueNewsInDB(
             current_news, current_news_embeddings, source_category, FULL_NEWS
         )
+        if article_id and SIMILARITY_BACKEND == "faiss":
+            add_vector(article_id, current_news_embeddings, current_news["link"])
 
     # dublicate news
     if somewhat_similar_news_id:
@@ -1,15 +1,87 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+
 from dateutil import parser
 
-def standardize_pub_dates(pub_dates):
-    standardized = []
-    tzinfos = {"EDT": -4 * 3600}  # EDT is UTC-4 hours
-    for date_str in pub_dates:
+# Feeds that omit the offset are Indian publishers
+DEFAULT_TZ = timezone(timedelta(hours=5, minutes=30))
+TZINFOS = {"EDT": -4 * 3600, "EST": -5 * 3600, "IST": 5 * 3600 + 1800, "GMT": 0, "UTC": 0}
+STORED_FORMAT = "%d-%m-%Y"
+
+RFC822 = "rfc822"  # Marker for the email.utils parser in the per-source format cache
+
+# Strict formats tried (in order) before falling back to dateutil
+KNOWN_FORMATS = (
+    RFC822,
+    "%Y-%m-%dT%H:%M:%S%z",
+    "%Y-%m-%dT%H:%M:%S.%f%z",
+    "%a, %d %b %Y %H:%M %z",
+    "%d %b %Y %H:%M:%S %z",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d",
+)
+
+# Format that last parsed a date from each source; one feed keeps one format
+_source_formats = {}
+
+
+def _parse_with(fmt: str, date_str: str):
+    if fmt == RFC822:
+        dt = parsedate_to_datetime(date_str)
+        if dt.tzinfo is None:
+            # Unknown zone name or -0000; let dateutil and TZINFOS decide
+            raise ValueError("No offset in RFC 822 date")
+        return dt
+    return datetime.strptime(date_str, fmt)
+
+
+def _aware(dt: datetime) -> datetime:
+    return dt if dt.tzinfo is not None else dt.replace(tzinfo=DEFAULT_TZ)
+
+
+def normalize_pub_date(date_str: str, source: str = None):
+    """
+    Parse a feed date into a timezone-aware datetime, or None when it cannot be parsed.
+
+    The format that worked last time for source is tried first, then the strict
+    KNOWN_FORMATS, and only then dateutil's heuristic parser.
+    """
+    if not date_str or len(date_str.strip()) < 6:
+        return None
+    date_str = date_str.strip()
+
+    cached = _source_formats.get(source)
+    formats = ((cached,) if cached else ()) + tuple(fmt for fmt in KNOWN_FORMATS if fmt != cached)
+    for fmt in formats:
         try:
-            if not date_str or len(date_str.strip()) < 6:
-                raise ValueError("Too short to be a date")
-            dt = parser.parse(date_str, tzinfos=tzinfos)
-            formatted = dt.strftime("%d-%m-%Y")
-            standardized.append(formatted)
-        except Exception as e:
-            standardized.append(f"Error parsing: {date_str} ({e})")
-    return standardized[0]
+            dt = _parse_with(fmt, date_str)
+        except (TypeError, ValueError, IndexError):
+            continue
+        _source_formats[source] = fmt
+        return _aware(dt)
+
+    try:
+        return _aware(parser.parse(date_str, tzinfos=TZINFOS))
+    except (ValueError, OverflowError):
+        return None
+
+
+def normalize_pub_dates(pub_dates, source: str = None) -> list:
+    """Normalize a whole feed's dates in one call; repeated strings are parsed once"""
+    parsed = {}
+    results = []
+    for date_str in pub_dates:
+        if date_str not in parsed:
+            parsed[date_str] = normalize_pub_date(date_str, source)
+        results.append(parsed[date_str])
+    return results
+
+
+def format_pub_date(dt):
+    """Stored pubDate string (dd-mm-yyyy in the date's own offset), None if unparsed"""
+    return dt.strftime(STORED_FORMAT) if dt is not None else None
+
+
+def standardize_pub_dates(pub_dates, source: str = None):
+    """Formatted pubDate of the first date in pub_dates (kept for older callers)"""
+    return format_pub_date(normalize_pub_date(pub_dates[0], source)) if pub_dates else None
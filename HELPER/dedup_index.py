@@ -0,0 +1,141 @@
+import glob
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
+
+from HELPER.jsonl_store import iter_items
+
+# Shared, on-disk index of normalised URLs and title hashes seen across every feed
+DEDUP_DB = os.path.join("cache", "dedup_index.sqlite3")
+DATA_FOLDER = "data"
+
+# Query parameters that only track where a click came from
+TRACKING_PARAMS = {"source", "medium", "campaign", "ref", "fbclid", "gclid", "from", "utm"}
+
+_lock = threading.Lock()
+_conn = None
+
+
+def normalize_url(url: str) -> str:
+    """Lower-case host, drop www., fragments, tracking parameters and trailing slashes"""
+    parsed = urlparse(url.strip())
+    host = parsed.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    query = urlencode(sorted(
+        (key, value) for key, value in parse_qsl(parsed.query)
+        if not key.lower().startswith("utm_") and key.lower() not in TRACKING_PARAMS
+    ))
+    path = parsed.path.rstrip("/") or "/"
+    return urlunparse(("", host, path, "", query, ""))
+
+
+def normalize_title(title: str) -> str:
+    title = re.sub(r"[^\w\s]", " ", title.lower())
+    return re.sub(r"\s+", " ", title).strip()
+
+
+def _hash(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:16]
+
+
+def _seed(conn) -> None:
+    """Fill a freshly created index from the article stores already on disk"""
+    paths = glob.glob(os.path.join(DATA_FOLDER, "*.jsonl")) + glob.glob(os.path.join(DATA_FOLDER, "*.json"))
+    now = time.time()
+    for path in paths:
+        name = os.path.splitext(os.path.basename(path))[0]
+        try:
+            for item in iter_items(path):
+                if not isinstance(item, dict):
+                    continue
+                url = item.get("link") or item.get("url")
+                title = item.get("title")
+                if url:
+                    conn.execute("INSERT OR IGNORE INTO seen_urls VALUES (?, ?, ?)", (_hash(normalize_url(url)), name, now))
+                if title:
+                    conn.execute("INSERT OR IGNORE INTO seen_titles VALUES (?, ?, ?)", (_hash(normalize_title(title)), name, now))
+        except Exception as e:
+            print(f"Skipping {path} while seeding dedup index: {e}")
+    conn.commit()
+
+
+def _connection():
+    global _conn
+    if _conn is None:
+        os.makedirs(os.path.dirname(DEDUP_DB), exist_ok=True)
+        is_new = not os.path.exists(DEDUP_DB)
+        _conn = sqlite3.connect(DEDUP_DB, check_same_thread=False, timeout=30)
+        _conn.execute("PRAGMA journal_mode=WAL")
+        _conn.execute("PRAGMA synchronous=NORMAL")
+        _conn.execute(
+            "CREATE TABLE IF NOT EXISTS seen_urls (hash TEXT PRIMARY KEY, feed TEXT, first_seen REAL) WITHOUT ROWID"
+        )
+        _conn.execute(
+            "CREATE TABLE IF NOT EXISTS seen_titles (hash TEXT PRIMARY KEY, feed TEXT, first_seen REAL) WITHOUT ROWID"
+        )
+        _conn.commit()
+        if is_new:
+            _seed(_conn)
+    return _conn
+
+
+def is_duplicate(url: str = "", title: str = "") -> bool:
+    with _lock:
+        conn = _connection()
+        if url and conn.execute(
+            "SELECT 1 FROM seen_urls WHERE hash = ?", (_hash(normalize_url(url)),)
+        ).fetchone():
+            return True
+        if title and conn.execute(
+            "SELECT 1 FROM seen_titles WHERE hash = ?", (_hash(normalize_title(title)),)
+        ).fetchone():
+            return True
+        return False
+
+
+def claim(url: str, title: str, feed: str) -> bool:
+    """
+    Record an item as seen. Returns False when its URL or title was already claimed by any
+    feed, in which case nothing is written.
+    """
+    url_hash = _hash(normalize_url(url)) if url else None
+    title_hash = _hash(normalize_title(title)) if title else None
+
+    with _lock:
+        conn = _connection()
+        try:
+            with conn:
+                return _claim(conn, url_hash, title_hash, feed)
+        except sqlite3.IntegrityError:
+            # Another process claimed it between our check and insert
+            return False
+
+
+def release(url: str, title: str, feed: str) -> None:
+    """Undo claim() for an item that feed failed to store"""
+    with _lock:
+        conn = _connection()
+        with conn:
+            if url:
+                conn.execute("DELETE FROM seen_urls WHERE hash = ? AND feed = ?", (_hash(normalize_url(url)), feed))
+            if title:
+                conn.execute("DELETE FROM seen_titles WHERE hash = ? AND feed = ?", (_hash(normalize_title(title)), feed))
+
+
+def _claim(conn, url_hash, title_hash, feed) -> bool:
+    if url_hash and conn.execute("SELECT 1 FROM seen_urls WHERE hash = ?", (url_hash,)).fetchone():
+        return False
+    if title_hash and conn.execute("SELECT 1 FROM seen_titles WHERE hash = ?", (title_hash,)).fetchone():
+        return False
+
+    now = time.time()
+    if url_hash:
+        conn.execute("INSERT INTO seen_urls VALUES (?, ?, ?)", (url_hash, feed, now))
+    if title_hash:
+        conn.execute("INSERT INTO seen_titles VALUES (?, ?, ?)", (title_hash, feed, now))
+    return True
@@ -8,16 +8,18 @@ from sentence_transformers import SentenceTransformer
 
 load_dotenv()
 
+EMBED_BATCH_SIZE = int(os.getenv("EMBED_BATCH_SIZE", 32))  # Texts per SentenceTransformer forward pass
+
 class NOMIC_EMBEDDINGS:
     def __init__(self):
         self.embed_model = SentenceTransformer("nomic-ai/nomic-embed-text-v1.5", trust_remote_code=True)
         self.target_dim = 768
         self.project_metadata = []
 
-    def embed_text(self, texts: list[str]) -> np.ndarray:
+    def embed_text(self, texts: list[str], batch_size: int = EMBED_BATCH_SIZE) -> np.ndarray:
         if not texts:
             return np.empty((0, self.target_dim), dtype="float32")
-        embs = self.embed_model.encode(texts, normalize_embeddings=True)
+        embs = self.embed_model.encode(texts, batch_size=batch_size, normalize_embeddings=True)
         return np.array(embs, dtype="float32")
 
 
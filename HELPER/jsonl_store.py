@@ -0,0 +1,197 @@
+import hashlib
+import json
+import os
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows: stores are only locked within the process
+    fcntl = None
+
+# Append-only article store: one JSON object per line in <name>.jsonl, plus a compact
+# sidecar index (<name>.jsonl.idx) holding one short title/URL hash per line. Writers hold the
+# store's thread lock and an flock on <name>.jsonl.lock, so the scheduler daemon, GNW and app.py
+# never interleave an append with a rewrite of the same store.
+
+_locks = {}
+_locks_guard = threading.Lock()
+
+
+def _lock_for(path: str) -> threading.Lock:
+    with _locks_guard:
+        return _locks.setdefault(os.path.abspath(path), threading.Lock())
+
+
+@contextmanager
+def _store_lock(path: str):
+    """Exclusive lock on a store across threads and processes"""
+    with _lock_for(path):
+        if fcntl is None:
+            yield
+            return
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(f"{path}.lock", "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _hash(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:16]
+
+
+def jsonl_path(json_file: str) -> str:
+    """Map a legacy data/<feed>.json path onto its .jsonl store"""
+    return os.path.splitext(json_file)[0] + ".jsonl"
+
+
+def index_path(store_file: str) -> str:
+    return f"{store_file}.idx"
+
+
+def item_keys(title: str = "", url: str = "") -> set:
+    """Index keys for an item: one for the exact title, one for the URL"""
+    keys = set()
+    if title:
+        keys.add("t" + _hash(title))
+    if url:
+        keys.add("u" + _hash(url))
+    return keys
+
+
+def _keys_for(item: dict) -> set:
+    return item_keys(item.get("title", ""), item.get("link") or item.get("url") or "")
+
+
+def _migrate_legacy_json(store_file: str) -> None:
+    """One-off conversion of a whole-file data/<feed>.json into the append-only store"""
+    legacy_file = os.path.splitext(store_file)[0] + ".json"
+    if os.path.exists(store_file) or not os.path.exists(legacy_file):
+        return
+
+    try:
+        with open(legacy_file, "r", encoding="utf-8") as f:
+            items = json.load(f)
+    except (json.JSONDecodeError, FileNotFoundError):
+        return
+    if not isinstance(items, list):
+        return
+
+    _write_lines(store_file, items, "w")
+    os.replace(legacy_file, f"{legacy_file}.migrated")
+
+
+def _write_lines(store_file: str, items, mode: str) -> None:
+    with open(store_file, mode, encoding="utf-8") as f:
+        for item in items:
+            f.write(json.dumps(item, ensure_ascii=False) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+    keys = set()
+    for item in items:
+        keys |= _keys_for(item)
+    with open(index_path(store_file), mode, encoding="utf-8") as f:
+        f.writelines(f"{key}\n" for key in keys)
+
+
+def _rebuild_index(store_file: str) -> None:
+    keys = set()
+    for item in iter_items(store_file):
+        keys |= _keys_for(item)
+    with open(index_path(store_file), "w", encoding="utf-8") as f:
+        f.writelines(f"{key}\n" for key in keys)
+
+
+def load_index(store_file: str) -> set:
+    """Load the title/URL hash index without reading the stored articles"""
+    with _store_lock(store_file):
+        _migrate_legacy_json(store_file)
+        if os.path.exists(store_file) and not os.path.exists(index_path(store_file)):
+            _rebuild_index(store_file)
+        try:
+            with open(index_path(store_file), "r", encoding="utf-8") as f:
+                return {line.strip() for line in f if line.strip()}
+        except FileNotFoundError:
+            return set()
+
+
+def append_items(store_file: str, items) -> int:
+    """Append new items (and their index keys) to the store; returns how many were written"""
+    items = list(items)
+    if not items:
+        return 0
+
+    directory = os.path.dirname(store_file)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with _store_lock(store_file):
+        _migrate_legacy_json(store_file)
+        _write_lines(store_file, items, "a")
+    return len(items)
+
+
+def iter_items(path: str):
+    """Yield stored articles from a .jsonl store (or a legacy .json list)"""
+    if not os.path.exists(path):
+        return
+    if path.endswith(".json"):
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        yield from (data if isinstance(data, list) else [])
+        return
+
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                # A torn final line from an interrupted write; everything before it is intact
+                continue
+
+
+def read_items(path: str) -> list:
+    return list(iter_items(path))
+
+
+def _replace_items(path: str, items) -> None:
+    tmp_file = f"{path}.tmp"
+    if path.endswith(".json"):
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(items, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_file, path)
+        return
+
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        for item in items:
+            f.write(json.dumps(item, ensure_ascii=False) + "\n")
+    os.replace(tmp_file, path)
+    _rebuild_index(path)
+
+
+def rewrite_items(path: str, items) -> None:
+    """Atomically replace the contents of a store (or legacy .json file)"""
+    items = list(items)
+    with _store_lock(path):
+        _replace_items(path, items)
+
+
+def update_items(path: str, update) -> bool:
+    """
+    Apply update(items) -> changed to a store and rewrite it only when something changed. The
+    store is read and replaced under one lock, so appends from other processes are never lost.
+    """
+    with _store_lock(path):
+        items = read_items(path)
+        if not update(items):
+            return False
+        _replace_items(path, items)
+        return True
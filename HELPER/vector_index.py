@@ -0,0 +1,161 @@
+import atexit
+import os
+import pickle
+import threading
+
+import faiss
+import numpy as np
+from dotenv import load_dotenv
+
+from DATABASE.fetch import get_all_vectors, get_vector_ids, get_vectors_by_ids
+
+load_dotenv()
+
+# Persistent approximate nearest-neighbour index over VECTORS_TABLE, so NEWS_SCORE looks up the
+# top-k closest stored articles instead of pulling every embedding back from Postgres. Vectors
+# are L2-normalised and searched by inner product (cosine similarity) in a FAISS HNSW graph;
+# faiss ids are positions in the article id / url lists kept alongside it in the .pkl file.
+INDEX_FILE = os.getenv("NEWS_INDEX_FILE", os.path.join("cache", "news_similarity_db.index"))
+META_FILE = os.getenv("NEWS_INDEX_META_FILE", os.path.join("cache", "news_similarity_db.pkl"))
+EMBEDDING_DIM = 768
+HNSW_M = int(os.getenv("NEWS_INDEX_HNSW_M", 32))  # Graph neighbours per node
+HNSW_EF_CONSTRUCTION = int(os.getenv("NEWS_INDEX_EF_CONSTRUCTION", 200))
+HNSW_EF_SEARCH = int(os.getenv("NEWS_INDEX_EF_SEARCH", 64))
+TOP_K = int(os.getenv("NEWS_INDEX_TOP_K", 10))
+SAVE_EVERY = int(os.getenv("NEWS_INDEX_SAVE_EVERY", 50))  # Unsaved additions before the index is written
+
+_lock = threading.Lock()
+_state = None  # {"index", "article_ids", "urls", "known", "unsaved"}
+
+
+def _new_index(dim: int = EMBEDDING_DIM):
+    hnsw = faiss.IndexHNSWFlat(dim, HNSW_M, faiss.METRIC_INNER_PRODUCT)
+    hnsw.hnsw.efConstruction = HNSW_EF_CONSTRUCTION
+    hnsw.hnsw.efSearch = HNSW_EF_SEARCH
+    return faiss.IndexIDMap2(hnsw)
+
+
+def _to_vector(embedding) -> np.ndarray:
+    """float32 row vector, normalised; VECTORS_TABLE rows already arrive as float32 arrays"""
+    vector = np.asarray(embedding, dtype=np.float32).reshape(1, -1)
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+def _add(state: dict, rows) -> int:
+    """Add (article_id, embedding, url) rows not already indexed; returns how many were added"""
+    vectors, ids = [], []
+    for article_id, embedding, url in rows:
+        article_id = str(article_id)
+        if article_id in state["known"]:
+            continue
+        state["known"].add(article_id)
+        ids.append(len(state["article_ids"]))
+        state["article_ids"].append(article_id)
+        state["urls"].append(url)
+        vectors.append(_to_vector(embedding))
+    if vectors:
+        state["index"].add_with_ids(np.vstack(vectors), np.asarray(ids, dtype=np.int64))
+        state["unsaved"] += len(vectors)
+    return len(vectors)
+
+
+def _empty_state() -> dict:
+    return {"index": _new_index(), "article_ids": [], "urls": [], "known": set(), "unsaved": 0}
+
+
+def _load() -> dict:
+    """Index from disk, reconciled with the ids in VECTORS_TABLE"""
+    global _state
+    if _state is not None:
+        return _state
+
+    state = None
+    try:
+        with open(META_FILE, "rb") as f:
+            meta = pickle.load(f)
+        if isinstance(meta, dict) and "article_ids" in meta:
+            state = {
+                "index": faiss.read_index(INDEX_FILE),
+                "article_ids": meta["article_ids"],
+                "urls": meta["urls"],
+                "known": set(meta["article_ids"]),
+                "unsaved": 0,
+            }
+            faiss.downcast_index(state["index"].index).hnsw.efSearch = HNSW_EF_SEARCH
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"Vector index unreadable, rebuilding: {e}")
+
+    db_ids = set(get_vector_ids())
+    if state is None or state["known"] - db_ids:
+        # HNSW cannot remove vectors, so rows deleted from the table mean a rebuild
+        state = _empty_state()
+        _add(state, get_all_vectors())
+        print(f"Vector index rebuilt from VECTORS_TABLE: {len(state['article_ids'])} vectors")
+    elif db_ids - state["known"]:
+        # Rows inserted after the last save (or by another process) are fetched by id
+        added = _add(state, get_vectors_by_ids(db_ids - state["known"]))
+        print(f"Vector index synced with VECTORS_TABLE: {added} vectors added, {len(state['article_ids'])} total")
+
+    _state = state
+    return _state
+
+
+def _save(state: dict) -> None:
+    os.makedirs(os.path.dirname(INDEX_FILE) or ".", exist_ok=True)
+    os.makedirs(os.path.dirname(META_FILE) or ".", exist_ok=True)
+    tmp_index, tmp_meta = f"{INDEX_FILE}.tmp", f"{META_FILE}.tmp"
+    faiss.write_index(state["index"], tmp_index)
+    with open(tmp_meta, "wb") as f:
+        pickle.dump({"dim": EMBEDDING_DIM, "article_ids": state["article_ids"], "urls": state["urls"]}, f)
+    os.replace(tmp_index, INDEX_FILE)
+    os.replace(tmp_meta, META_FILE)
+    state["unsaved"] = 0
+
+
+def search(embedding, k: int = TOP_K, exclude_url: str = None) -> list:
+    """Up to k (article_id, cosine_score) pairs, best first, skipping the article at exclude_url"""
+    with _lock:
+        state = _load()
+        if not state["article_ids"]:
+            return []
+        # One extra hit in case the article itself is already indexed
+        scores, ids = state["index"].search(_to_vector(embedding), k + 1)
+
+    results = []
+    for score, idx in zip(scores[0], ids[0]):
+        if idx < 0 or state["urls"][idx] == exclude_url:
+            continue
+        results.append((state["article_ids"][idx], float(score)))
+    return results[:k]
+
+
+def add_vector(article_id, embedding, url: str) -> None:
+    """Index a newly inserted article; the index is written every SAVE_EVERY additions"""
+    with _lock:
+        state = _load()
+        _add(state, [(article_id, embedding, url)])
+        if state["unsaved"] >= SAVE_EVERY:
+            _save(state)
+
+
+def save_index() -> None:
+    with _lock:
+        if _state is not None and _state["unsaved"]:
+            _save(_state)
+
+
+def rebuild_index() -> int:
+    """Recreate the index from every row of VECTORS_TABLE"""
+    global _state
+    with _lock:
+        state = _empty_state()
+        _add(state, get_all_vectors())
+        _save(state)
+        _state = state
+        return len(state["article_ids"])
+
+
+atexit.register(save_index)
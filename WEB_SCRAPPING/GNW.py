@@ -1,21 +1,37 @@
 import json
-import requests
 from bs4 import BeautifulSoup
 import time
 import os
 import re
 import logging
-from typing import Optional, Dict, List, Tuple
+from typing import Optional, Dict, List
 import random
 from urllib.parse import urlparse, urljoin
 from datetime import datetime
-import chardet
-from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
-import hashlib
 from collections import Counter
 import nltk
-from nltk.corpus import stopwords
 from nltk.tokenize import sent_tokenize, word_tokenize
+import sys
+import threading
+from queue import Queue, Empty
+base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+# insert it so that python can resolve the package
+sys.path.insert(0, base_dir)
+from proxy.session import http_get
+from WEB_SCRAPPING.browser_pool import lease_page, close_pool, warm_up
+from WEB_SCRAPPING.fetch_tiers import get_tier, remember_tier, STATIC, RENDER
+from WEB_SCRAPPING.dom_extractor import extract_main_block, block_text
+from WEB_SCRAPPING.extraction_templates import (
+    get_template, remember_template, selector_for, template_hit, template_miss, TEMPLATE_MIN_CHARS
+)
+from WEB_SCRAPPING.html_parser import make_soup
+from WEB_SCRAPPING.text_quality import filter_fragments
+from WEB_SCRAPPING.encoding_detection import decode_html
+from WEB_SCRAPPING.article_sink import (
+    is_written, write_article, store_path, load_checkpoint, save_checkpoint
+)
+from WEB_SCRAPPING.master_index import load_master_index, rebuild_master_index, save_master_index
+from WEB_SCRAPPING.politeness import interleave_by_domain, domain_slot, wait_turn, backoff
 
 # Download required NLTK data (run once)
 try:
@@ -27,12 +43,15 @@ except LookupError:
 
 # Configuration
 OUTPUT_FOLDER = "data"
-REQUEST_DELAY = (1, 3)
+REQUEST_DELAY = (1, 3)  # Seconds between request starts on one domain
+MAX_WORKERS = int(os.getenv("SCRAPER_MAX_WORKERS", 8))  # Articles scraped concurrently (across domains)
+CHECKPOINT_EVERY = 10  # Articles between run checkpoints
 TIMEOUT = 30
 CONTENT_MIN_LENGTH = 10  # Reduced minimum
 MAX_RETRIES = 5  # Increased retries
-CONTENT_QUALITY_THRESHOLD = 0.3  # Lower threshold for aggressive extraction
 MIN_SENTENCES = 1  # Minimum sentences for content acceptance
+BODY_PROBE_MIN_CHARS = 600  # Paragraph text that counts as a server-rendered article body
+BODY_PROBE_MIN_PARAGRAPH = 40  # Shorter <p> blocks (captions, bylines) are ignored by the probe
 
 # Setup logging
 logging.basicConfig(
@@ -55,34 +74,9 @@ USER_AGENTS = [
     "Mozilla/5.0 (X11; Linux x86_64; rv:109.0) Gecko/20100101 Firefox/121.0",
 ]
 
-# Expanded garbage patterns with more lenient detection
-GARBAGE_PATTERNS = [
-    r"^\s*(javascript|error|404|page not found|loading|redirect)\s*$",
-    r"^\s*(advertisement|sponsored content|ads by|click here)\s*$",
-    r"^\s*(\w{1,2}|\d+)\s*$",
-    r"^\s*(home|menu|search|login|signup|next|previous|back|share|like|tweet)\s*$",
-    r"^\s*(cookie|privacy policy|terms of service|subscribe|newsletter)\s*$",
-    r"^\s*[\W\d\s]*$",
-    r"^\s*(comments?|reply|show more|load more|continue reading)\s*$",
-    r"^\s*(follow us|social media|connect with us)\s*$",
-]
-
-# News-specific content indicators
-CONTENT_INDICATORS = [
-    'article', 'story', 'news', 'content', 'text', 'body', 'main', 'post', 
-    'entry', 'detail', 'full', 'complete', 'primary', 'editorial'
-]
-
-# Get English stopwords
-try:
-    ENGLISH_STOPWORDS = set(stopwords.words('english'))
-except:
-    ENGLISH_STOPWORDS = set()
-
-def create_session():
-    """Enhanced session with more realistic headers"""
-    session = requests.Session()
-    headers = {
+def browser_headers() -> Dict[str, str]:
+    """Realistic browser headers, sent per request over the shared keep-alive session"""
+    return {
         "User-Agent": random.choice(USER_AGENTS),
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
         "Accept-Language": "en-US,en;q=0.9,hi;q=0.8",
@@ -102,112 +96,15 @@ def create_session():
             "https://facebook.com"
         ]),
     }
-    session.headers.update(headers)
-    return session
 
 def detect_and_fix_encoding(response) -> str:
-    """Enhanced encoding detection with more attempts"""
+    """Decode a response body (BOM, declared charset, <meta charset>, then a sampled detector)"""
     try:
-        # First try the response's apparent encoding
-        if response.encoding and response.encoding.lower() not in ['iso-8859-1', 'windows-1252']:
-            try:
-                decoded = response.text
-                if decoded and not '\ufffd' in decoded[:1000]:  # Check for replacement chars
-                    return decoded
-            except:
-                pass
-
-        # Use chardet with lower confidence threshold
-        detected = chardet.detect(response.content)
-        if detected and detected["encoding"] and detected["confidence"] > 0.5:
-            try:
-                return response.content.decode(detected["encoding"])
-            except (UnicodeDecodeError, LookupError):
-                pass
-
-        # Try more encodings
-        for encoding in ["utf-8", "utf-16", "utf-16le", "utf-16be", "windows-1252", "iso-8859-1", "cp1252", "latin1"]:
-            try:
-                decoded = response.content.decode(encoding)
-                # Simple validation: check if it contains reasonable text
-                if len(decoded) > 100 and decoded.count('�') / len(decoded) < 0.1:
-                    return decoded
-            except (UnicodeDecodeError, LookupError):
-                continue
-
-        # Last resort: force decode with error handling
-        return response.content.decode('utf-8', errors='replace')
+        return decode_html(response.content, response.encoding, urlparse(response.url).netloc.lower())
     except Exception as e:
         logger.warning(f"Encoding detection failed: {e}")
         return response.text
 
-def calculate_text_quality(text: str) -> float:
-    """Calculate text quality score based on various metrics"""
-    if not text or len(text.strip()) < 10:
-        return 0.0
-    
-    text_clean = text.strip().lower()
-    words = text_clean.split()
-    
-    if len(words) < 3:
-        return 0.1
-    
-    # Check character composition
-    alpha_chars = len(re.findall(r'[a-zA-Z]', text))
-    total_chars = len(text.replace(' ', ''))
-    alpha_ratio = alpha_chars / max(total_chars, 1)
-    
-    # Check average word length
-    avg_word_length = sum(len(word) for word in words) / len(words)
-    
-    # Check sentence structure
-    sentences = re.split(r'[.!?]+', text)
-    sentence_count = len([s for s in sentences if len(s.strip()) > 10])
-    
-    # Check for common English words
-    english_words = sum(1 for word in words if word in ENGLISH_STOPWORDS) if ENGLISH_STOPWORDS else 0
-    english_ratio = english_words / len(words)
-    
-    # Check punctuation ratio
-    punct_count = len(re.findall(r'[.!?,:;]', text))
-    punct_ratio = punct_count / len(words)
-    
-    # Calculate composite score
-    quality_score = (
-        alpha_ratio * 0.3 +
-        min(avg_word_length / 6, 1) * 0.2 +
-        min(sentence_count / 3, 1) * 0.2 +
-        min(english_ratio * 2, 1) * 0.2 +
-        min(punct_ratio * 10, 1) * 0.1
-    )
-    
-    return quality_score
-
-def is_garbage(text: str) -> bool:
-    """Enhanced garbage detection with quality scoring"""
-    if not text or len(text.strip()) < 10:  # Reduced from 15
-        return True
-
-    text_clean = text.strip().lower()
-
-    # Check garbage patterns
-    for pattern in GARBAGE_PATTERNS:
-        if re.match(pattern, text_clean, re.IGNORECASE):
-            return True
-
-    # Use quality scoring for better detection
-    quality = calculate_text_quality(text)
-    if quality < CONTENT_QUALITY_THRESHOLD:
-        return True
-
-    # Check for navigation/UI patterns
-    nav_keywords = ['click', 'tap', 'swipe', 'menu', 'button', 'link', 'navigation', 'sidebar']
-    nav_ratio = sum(1 for keyword in nav_keywords if keyword in text_clean) / max(len(text_clean.split()), 1)
-    if nav_ratio > 0.3:
-        return True
-
-    return False
-
 def clean_text_enhanced(text: str) -> str:
     """Enhanced text cleaning with better encoding handling"""
     if not text:
@@ -274,14 +171,15 @@ def extract_json_ld(soup) -> List[str]:
                 for field in content_fields:
                     if field in item and item[field]:
                         content = str(item[field]).strip()
-                        if len(content) > 100 and not is_garbage(content):
+                        if len(content) > 100:
                             contents.append(content)
                             
         except Exception as e:
             logger.debug(f"Error parsing JSON-LD: {e}")
             continue
     
-    return contents
+    # All candidates are scored in one batch
+    return filter_fragments(contents)
 
 def extract_meta_content(soup) -> List[str]:
     """Extract content from meta tags"""
@@ -299,307 +197,168 @@ def extract_meta_content(soup) -> List[str]:
             meta = soup.find('meta', {attr: prop})
             if meta and meta.get('content'):
                 content = meta['content'].strip()
-                if len(content) > 50 and not is_garbage(content):
+                if len(content) > 50:
                     contents.append(content)
     
-    return contents
+    # og:/twitter:/plain descriptions usually repeat, and repeats are scored once
+    return filter_fragments(contents)
 
-def score_element_content(element, base_score: int = 0) -> Tuple[int, str]:
-    """Score an element based on content quality indicators"""
-    if not element:
-        return 0, ""
-    
-    text = element.get_text(separator=' ', strip=True)
-    if not text or is_garbage(text):
-        return 0, ""
-    
-    score = base_score + len(text)
-    
-    # Bonus for content indicators in class/id
-    class_id = ' '.join(element.get('class', []) + [element.get('id', '')])
-    for indicator in CONTENT_INDICATORS:
-        if indicator in class_id.lower():
-            score += 500
-    
-    # Bonus for paragraph structure
-    paragraphs = element.find_all('p')
-    score += len(paragraphs) * 100
-    
-    # Bonus for semantic HTML5 tags
-    if element.name in ['article', 'main', 'section']:
-        score += 300
-    
-    # Penalty for nav/sidebar indicators
-    nav_indicators = ['nav', 'sidebar', 'menu', 'footer', 'header', 'aside']
-    for indicator in nav_indicators:
-        if indicator in class_id.lower():
-            score -= 200
-    
-    return score, text
+def extract_with_template(soup, domain: str) -> Optional[str]:
+    """Body text from the domain's cached selector, None when there is none or it misses"""
+    selector = get_template(domain)
+    if not selector:
+        return None
 
-def extract_content(soup) -> Optional[str]:
-    """Ultra-aggressive content extraction using multiple strategies"""
-    
-    content_candidates = []
-    
-    # Strategy 1: Enhanced main content selectors
-    main_selectors = [
-        'article', 'main', '[role="main"]',
-        '.article-content', '.story-content', '.post-content', '.entry-content',
-        '.article-body', '.story-body', '.post-body', '.news-content',
-        '.content-area', '.main-content', '.primary-content', '.article-text',
-        '#main-content', '#content', '#article', '#story', '#post',
-        '.text-content', '.full-content', '.article-detail', '.news-body',
-        '[class*="content"]', '[class*="article"]', '[class*="story"]',
-        '[class*="text"]', '[class*="body"]', '[id*="content"]',
-        '[id*="article"]', '[id*="story"]', '[id*="text"]'
-    ]
-
-    for selector in main_selectors:
-        try:
-            elements = soup.select(selector)
-            for element in elements:
-                score, text = score_element_content(element, 1000)
-                if score > 500 and len(text) > 100:
-                    content_candidates.append((score, text, f"main_selector_{selector}"))
-        except Exception as e:
-            logger.debug(f"Error with selector {selector}: {e}")
-
-    # Strategy 2: Largest meaningful div/section elements
-    try:
-        large_elements = soup.find_all(['div', 'section', 'span'], 
-                                     string=False, 
-                                     recursive=True)
-        
-        for element in large_elements:
-            if len(str(element)) > 1000:  # Only check substantial elements
-                score, text = score_element_content(element)
-                if score > 300 and len(text) > 200:
-                    content_candidates.append((score, text, "large_element"))
-                    
-    except Exception as e:
-        logger.debug(f"Error in large element extraction: {e}")
-
-    # Strategy 3: Paragraph aggregation with quality scoring
-    try:
-        all_paragraphs = []
-        for tag in soup.find_all(['p', 'div', 'span', 'li']):
-            text = tag.get_text(separator=' ', strip=True)
-            if len(text) > 30 and not is_garbage(text):
-                quality = calculate_text_quality(text)
-                if quality > 0.2:  # Lower threshold
-                    all_paragraphs.append((quality, text))
-
-        if len(all_paragraphs) >= 2:
-            # Sort by quality and take best paragraphs
-            all_paragraphs.sort(key=lambda x: x[0], reverse=True)
-            best_paragraphs = [text for _, text in all_paragraphs[:20]]  # Top 20
-            
-            combined_content = '\n\n'.join(best_paragraphs)
-            if len(combined_content) > 200:
-                content_candidates.append((800, combined_content, "paragraph_aggregation"))
-                
-    except Exception as e:
-        logger.debug(f"Error in paragraph aggregation: {e}")
-
-    # Strategy 4: JSON-LD structured data
     try:
-        json_contents = extract_json_ld(soup)
-        for content in json_contents:
-            if len(content) > 100:
-                content_candidates.append((900, content, "json_ld"))
+        element = soup.select_one(selector)
     except Exception as e:
-        logger.debug(f"Error in JSON-LD extraction: {e}")
+        logger.debug(f"Error with template {selector} for {domain}: {e}")
+        element = None
+    text = (block_text(element) or element.get_text(" ", strip=True)) if element else ""
+
+    if len(text) < TEMPLATE_MIN_CHARS:
+        template_miss(domain)
+        return None
+    template_hit(domain)
+    logger.info(f"Content extracted using: template {selector}")
+    return text
+
+def extract_content(soup, url: str = None) -> Optional[str]:
+    """
+    Article body from the domain's learned template when url is given, otherwise from a
+    single scoring pass over the DOM (see dom_extractor), falling back to JSON-LD and then
+    meta tag content when the page has no usable body block.
+    """
+    domain = urlparse(url).netloc.lower() if url else None
+    if domain:
+        text = extract_with_template(soup, domain)
+        if text:
+            return clean_text_enhanced(text)
 
-    # Strategy 5: Meta tag content
-    try:
-        meta_contents = extract_meta_content(soup)
-        combined_meta = '\n\n'.join(meta_contents)
-        if len(combined_meta) > 100:
-            content_candidates.append((600, combined_meta, "meta_tags"))
-    except Exception as e:
-        logger.debug(f"Error in meta extraction: {e}")
+    content_candidates = []
 
-    # Strategy 6: Text density analysis
     try:
-        text_blocks = []
-        for element in soup.find_all(['div', 'section', 'article', 'p']):
-            text = element.get_text(separator=' ', strip=True)
-            if len(text) > 100:
-                # Calculate text density (text length vs HTML length)
-                html_length = len(str(element))
-                density = len(text) / max(html_length, 1)
-                
-                if density > 0.3:  # High text density
-                    quality = calculate_text_quality(text)
-                    score = int(density * 1000 + quality * 500)
-                    text_blocks.append((score, text))
-        
-        if text_blocks:
-            text_blocks.sort(key=lambda x: x[0], reverse=True)
-            best_text = text_blocks[0][1]
-            if len(best_text) > 200:
-                content_candidates.append((text_blocks[0][0], best_text, "text_density"))
-                
+        block = extract_main_block(soup)
+        if block:
+            text, score, element = block
+            content_candidates.append((score, text, "dom_block"))
+            if domain and not get_template(domain):
+                # Remember the winning block so later pages of this domain skip the scoring pass
+                selector = selector_for(element, soup)
+                if selector:
+                    remember_template(domain, selector)
     except Exception as e:
-        logger.debug(f"Error in text density analysis: {e}")
+        logger.debug(f"Error in DOM block extraction: {e}")
 
-    # Strategy 7: Visible text extraction as absolute fallback
-    try:
-        visible_texts = []
-        for text in soup.stripped_strings:
-            text_clean = text.strip()
-            if len(text_clean) > 20 and not is_garbage(text_clean):
-                quality = calculate_text_quality(text_clean)
-                if quality > 0.1:  # Very low threshold
-                    visible_texts.append(text_clean)
-        
-        if len(visible_texts) >= 3:
-            combined_visible = '\n'.join(visible_texts)
-            if len(combined_visible) > 150:
-                content_candidates.append((400, combined_visible, "visible_text_fallback"))
-                
-    except Exception as e:
-        logger.debug(f"Error in visible text extraction: {e}")
+    if not content_candidates:
+        try:
+            json_contents = [content for content in extract_json_ld(soup) if len(content) > 100]
+            if json_contents:
+                content_candidates.append((0, max(json_contents, key=len), "json_ld"))
+        except Exception as e:
+            logger.debug(f"Error in JSON-LD extraction: {e}")
 
-    # Strategy 8: Raw text extraction from largest text nodes
-    try:
-        all_text_nodes = soup.find_all(string=True)
-        substantial_texts = []
-        
-        for text in all_text_nodes:
-            if text.parent and text.parent.name not in ['script', 'style', 'noscript']:
-                cleaned = clean_text_enhanced(str(text))
-                if len(cleaned) > 50 and not is_garbage(cleaned):
-                    substantial_texts.append(cleaned)
-        
-        if substantial_texts:
-            # Take longest texts
-            substantial_texts.sort(key=len, reverse=True)
-            combined_raw = '\n'.join(substantial_texts[:10])  # Top 10 longest
-            if len(combined_raw) > 100:
-                content_candidates.append((300, combined_raw, "raw_text_nodes"))
-                
-    except Exception as e:
-        logger.debug(f"Error in raw text extraction: {e}")
+    if not content_candidates:
+        try:
+            combined_meta = '\n\n'.join(extract_meta_content(soup))
+            if len(combined_meta) > 100:
+                content_candidates.append((0, combined_meta, "meta_tags"))
+        except Exception as e:
+            logger.debug(f"Error in meta extraction: {e}")
 
-    # Select best content
     if content_candidates:
-        # Sort by score, prefer main selectors and JSON-LD
-        content_candidates.sort(key=lambda x: (
-            x[2].startswith('main_selector') * 1000 +
-            x[2] == 'json_ld' * 800 +
-            x[0]
-        ), reverse=True)
-        
         best_score, best_content, best_method = content_candidates[0]
-        logger.info(f"Content extracted using: {best_method} (score: {best_score})")
+        logger.info(f"Content extracted using: {best_method} (score: {best_score:.0f})")
         return clean_text_enhanced(best_content)
 
     return None
 
-def get_page_content(url: str, use_playwright: bool = True) -> Optional[BeautifulSoup]:
-    """Enhanced page content retrieval with multiple fallback methods"""
-    
-    # Method 1: Playwright (JavaScript rendering)
-    if use_playwright:
-        try:
-            with sync_playwright() as p:
-                # Try different browsers
-                for browser_type in [p.chromium, p.firefox, p.webkit]:
-                    try:
-                        browser = browser_type.launch(
-                            headless=True,
-                            args=[
-                                '--no-sandbox',
-                                '--disable-dev-shm-usage',
-                                '--disable-blink-features=AutomationControlled',
-                                '--disable-extensions',
-                                '--disable-plugins',
-                                '--disable-images'  # Faster loading
-                            ]
-                        )
-                        
-                        context = browser.new_context(
-                            user_agent=random.choice(USER_AGENTS),
-                            viewport={'width': 1920, 'height': 1080},
-                            extra_http_headers={
-                                'Accept-Language': 'en-US,en;q=0.9',
-                                'Accept-Encoding': 'gzip, deflate, br'
-                            }
-                        )
-                        
-                        page = context.new_page()
-                        
-                        # Set longer timeout and wait for content
-                        page.set_default_timeout(45000)
-                        response = page.goto(url, wait_until='domcontentloaded', timeout=45000)
-                        
-                        if response and response.status < 400:
-                            # Wait for dynamic content
-                            page.wait_for_timeout(3000)
-                            
-                            # Try to click "read more" or "continue reading" buttons
-                            try:
-                                read_more_selectors = [
-                                    'button:has-text("Read more")',
-                                    'button:has-text("Continue reading")',
-                                    'a:has-text("Read more")',
-                                    'a:has-text("Continue reading")',
-                                    '.read-more', '.continue-reading'
-                                ]
-                                
-                                for selector in read_more_selectors:
-                                    try:
-                                        page.click(selector, timeout=2000)
-                                        page.wait_for_timeout(2000)
-                                        break
-                                    except:
-                                        continue
-                            except:
-                                pass
-                            
-                            content = page.content()
-                            browser.close()
-                            
-                            if content and len(content) > 1000:
-                                return BeautifulSoup(content, 'html.parser')
+def has_article_body(soup) -> bool:
+    """Cheap probe: does the HTML already contain a server-rendered article body?"""
+    if soup is None:
+        return False
+
+    for script in soup.find_all('script', type='application/ld+json'):
+        if script.string and '"articleBody"' in script.string:
+            return True
+
+    body_chars = 0
+    for paragraph in soup.find_all('p'):
+        text = paragraph.get_text(strip=True)
+        if len(text) >= BODY_PROBE_MIN_PARAGRAPH:
+            body_chars += len(text)
+            if body_chars >= BODY_PROBE_MIN_CHARS:
+                return True
+    return False
+
+def fetch_rendered(url: str) -> Optional[BeautifulSoup]:
+    """JavaScript rendering on a page leased from the warm browser pool"""
+    try:
+        with lease_page() as page:
+            wait_turn(url, REQUEST_DELAY)
+            response = page.goto(url, wait_until='domcontentloaded', timeout=45000)
+            
+            if response and response.status < 400:
+                # Wait for dynamic content
+                page.wait_for_timeout(3000)
+                
+                # Try to click "read more" or "continue reading" buttons
+                try:
+                    read_more_selectors = [
+                        'button:has-text("Read more")',
+                        'button:has-text("Continue reading")',
+                        'a:has-text("Read more")',
+                        'a:has-text("Continue reading")',
+                        '.read-more', '.continue-reading'
+                    ]
                     
-                    except Exception as e:
-                        logger.debug(f"Browser {browser_type.name} failed: {e}")
+                    for selector in read_more_selectors:
                         try:
-                            browser.close()
+                            page.click(selector, timeout=2000)
+                            page.wait_for_timeout(2000)
+                            break
                         except:
-                            pass
-                        continue
-                        
-        except Exception as e:
-            logger.warning(f"All Playwright attempts failed: {e}")
+                            continue
+                except:
+                    pass
+                
+                content = page.content()
+                if content and len(content) > 1000:
+                    return make_soup(content)
+                    
+    except Exception as e:
+        logger.warning(f"Playwright attempt failed: {e}")
 
-    # Method 2: Enhanced requests with session
-    session = create_session()
+    return None
+
+def fetch_static(url: str) -> Optional[BeautifulSoup]:
+    """Plain HTTP fetch over the shared session, with a Googlebot fallback"""
+    # Enhanced requests over the shared session (this loop does its own retries)
+    headers = browser_headers()
     
     for attempt in range(MAX_RETRIES):
         try:
             # Rotate User-Agent for each attempt
-            session.headers['User-Agent'] = random.choice(USER_AGENTS)
+            headers['User-Agent'] = random.choice(USER_AGENTS)
             
-            response = session.get(url, timeout=TIMEOUT, allow_redirects=True)
+            wait_turn(url, REQUEST_DELAY)
+            response = http_get(url, retry=False, headers=headers, timeout=TIMEOUT, allow_redirects=True)
             
             if response.status_code == 200:
                 html_content = detect_and_fix_encoding(response)
                 if html_content and len(html_content) > 500:
-                    return BeautifulSoup(html_content, 'html.parser')
+                    return make_soup(html_content)
             
             elif response.status_code in [403, 429]:
-                # Rate limiting or blocking, wait longer
-                time.sleep(random.uniform(5, 10))
+                # Rate limiting or blocking: pause this domain only, honouring Retry-After
+                retry_after = response.headers.get("Retry-After", "")
+                backoff(url, float(retry_after) if retry_after.isdigit() else random.uniform(5, 10))
                 
         except Exception as e:
             logger.debug(f"Request attempt {attempt + 1} failed: {e}")
-            time.sleep(random.uniform(2, 5))
+            backoff(url, random.uniform(2, 5))
     
-    # Method 3: Try with different headers and no session
+    # Fallback: Googlebot headers
     try:
         headers = {
             'User-Agent': 'Mozilla/5.0 (compatible; Googlebot/2.1; +http://www.google.com/bot.html)',
@@ -609,18 +368,48 @@ def get_page_content(url: str, use_playwright: bool = True) -> Optional[Beautifu
             'Connection': 'keep-alive',
         }
         
-        response = requests.get(url, headers=headers, timeout=TIMEOUT)
+        wait_turn(url, REQUEST_DELAY)
+        response = http_get(url, retry=False, headers=headers, timeout=TIMEOUT)
         if response.status_code == 200:
             html_content = detect_and_fix_encoding(response)
             if html_content:
-                return BeautifulSoup(html_content, 'html.parser')
+                return make_soup(html_content)
                 
     except Exception as e:
         logger.debug(f"Googlebot attempt failed: {e}")
 
-    logger.error(f"All methods failed to fetch content for: {url}")
     return None
 
+def get_page_content(url: str, use_playwright: bool = True) -> Optional[BeautifulSoup]:
+    """
+    Tiered page retrieval: a static fetch first, JavaScript rendering only when the static
+    HTML has no article body. The tier that worked is remembered per domain, so later URLs
+    from that domain go straight to it.
+    """
+    domain = urlparse(url).netloc.lower()
+    tier = get_tier(domain)
+    soup = None
+
+    if tier != RENDER or not use_playwright:
+        soup = fetch_static(url)
+        if has_article_body(soup):
+            remember_tier(domain, STATIC)
+            return soup
+
+    if use_playwright:
+        rendered = fetch_rendered(url)
+        if rendered is not None:
+            if has_article_body(rendered):
+                remember_tier(domain, RENDER)
+            return rendered
+        if tier == RENDER:
+            # Rendering failed on a domain we usually render; the static HTML is better than nothing
+            soup = fetch_static(url)
+
+    if soup is None:
+        logger.error(f"All methods failed to fetch content for: {url}")
+    return soup
+
 def extract_title(soup) -> str:
     """Enhanced title extraction with multiple fallbacks"""
     title_candidates = []
@@ -715,7 +504,7 @@ def scrape_article(url: str, source: str) -> Optional[Dict]:
             return None
 
         title = extract_title(soup)
-        content = extract_content(soup)
+        content = extract_content(soup, url)
 
         # Enhanced content validation with multiple acceptance criteria
         if content:
@@ -893,91 +682,6 @@ def scrape_article(url: str, source: str) -> Optional[Dict]:
         except:
             return None
 
-def save_to_json_by_website(articles: List[Dict], source: str, base_folder: str):
-    """Enhanced saving with better organization and metadata"""
-    if not articles:
-        logger.warning(f"No articles to save for source: {source}")
-        return
-
-    try:
-        os.makedirs(base_folder, exist_ok=True)
-        
-        # Create safe filename
-        safe_source_name = re.sub(r'[<>:"/\\|?*]', '_', source).strip('.')
-        filename = os.path.join(base_folder, f"{safe_source_name}.json")
-
-        existing_articles = []
-        if os.path.exists(filename):
-            try:
-                with open(filename, 'r', encoding='utf-8') as f:
-                    existing_articles = json.load(f)
-                    if not isinstance(existing_articles, list):
-                        existing_articles = []
-            except Exception as e:
-                logger.warning(f"Could not load existing file {filename}: {e}")
-                existing_articles = []
-
-        # Merge articles with enhanced deduplication
-        existing_urls = {article.get('url') for article in existing_articles if isinstance(article, dict)}
-        new_articles = []
-        
-        for article in articles:
-            if article.get('url') not in existing_urls:
-                # Add additional metadata
-                article['content_hash'] = hashlib.md5(
-                    article.get('content', '').encode('utf-8')
-                ).hexdigest()[:16]
-                new_articles.append(article)
-
-        if new_articles:
-            all_articles = existing_articles + new_articles
-            all_articles.sort(key=lambda x: x.get('scraped_at', ''), reverse=True)
-
-            # Save main file
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(all_articles, f, indent=2, ensure_ascii=False)
-
-            # Create enhanced summary
-            summary_file = os.path.join(base_folder, f"{safe_source_name}_summary.txt")
-            successful_extractions = sum(1 for a in all_articles if a.get('extraction_success', False))
-            total_words = sum(a.get('word_count', 0) for a in all_articles)
-            
-            with open(summary_file, 'w', encoding='utf-8') as f:
-                f.write(f"Enhanced Summary for {source}\n")
-                f.write("=" * 60 + "\n")
-                f.write(f"Total articles: {len(all_articles)}\n")
-                f.write(f"Successful extractions: {successful_extractions} ({successful_extractions/len(all_articles)*100:.1f}%)\n")
-                f.write(f"Total words extracted: {total_words:,}\n")
-                f.write(f"Average words per article: {total_words//max(len(all_articles), 1)}\n")
-                f.write(f"Last updated: {datetime.now().isoformat()}\n\n")
-                
-                # Extraction method breakdown
-                methods = {}
-                for article in all_articles:
-                    method = article.get('extraction_method', 'standard')
-                    methods[method] = methods.get(method, 0) + 1
-                
-                f.write("Extraction Methods:\n")
-                f.write("-" * 30 + "\n")
-                for method, count in sorted(methods.items()):
-                    f.write(f"{method}: {count} articles\n")
-                
-                f.write(f"\nRecent articles:\n")
-                f.write("-" * 30 + "\n")
-                for i, article in enumerate(all_articles[:15], 1):
-                    success_indicator = "✅" if article.get('extraction_success') else "⚠️"
-                    f.write(f"{i:2d}. {success_indicator} {article.get('title', 'Untitled')[:70]}\n")
-                    f.write(f"    Words: {article.get('word_count', 0)}, Method: {article.get('extraction_method', 'standard')}\n")
-
-            logger.info(f"✓ Saved {len(new_articles)} new articles to {filename}")
-            logger.info(f"✓ Success rate: {successful_extractions}/{len(all_articles)} ({successful_extractions/len(all_articles)*100:.1f}%)")
-
-        else:
-            logger.info(f"No new articles to save for {source}")
-
-    except Exception as e:
-        logger.error(f"Error saving articles for {source}: {e}")
-
 def infer_source_name(url: str) -> str:
     """Enhanced source name inference with more comprehensive mapping"""
     try:
@@ -1100,160 +804,17 @@ def infer_source_name(url: str) -> str:
         return "Unknown_Source"
 
 def create_master_index(base_folder: str):
-    """Create enhanced master index with detailed analytics"""
+    """Rebuild the master index and extraction report from every store (normally kept up to date incrementally)"""
     try:
-        master_index = {
-            'created_at': datetime.now().isoformat(),
-            'total_sources': 0,
-            'total_articles': 0,
-            'successful_extractions': 0,
-            'extraction_success_rate': 0.0,
-            'total_words': 0,
-            'average_words_per_article': 0,
-            'extraction_methods': {},
-            'content_quality_tiers': {},
-            'sources': {}
-        }
-
-        if not os.path.exists(base_folder):
-            return
-
-        all_articles = []
-        
-        for filename in os.listdir(base_folder):
-            if filename.endswith('.json') and not filename.startswith('master_index'):
-                filepath = os.path.join(base_folder, filename)
-
-                try:
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        articles = json.load(f)
-
-                    if isinstance(articles, list) and articles:
-                        source_name = filename.replace('.json', '')
-                        article_count = len(articles)
-                        successful_count = sum(1 for a in articles if a.get('extraction_success', False))
-                        total_source_words = sum(a.get('word_count', 0) for a in articles)
-                        
-                        # Analyze extraction methods for this source
-                        source_methods = {}
-                        for article in articles:
-                            method = article.get('extraction_method', 'standard')
-                            source_methods[method] = source_methods.get(method, 0) + 1
-                        
-                        # Analyze content quality tiers
-                        source_tiers = {}
-                        for article in articles:
-                            tier = article.get('content_quality_tier', 'unknown')
-                            source_tiers[str(tier)] = source_tiers.get(str(tier), 0) + 1
-
-                        latest_date = max(
-                            (a.get('scraped_at', '') for a in articles if a.get('scraped_at')),
-                            default=''
-                        )
-
-                        master_index['sources'][source_name] = {
-                            'article_count': article_count,
-                            'successful_extractions': successful_count,
-                            'success_rate': successful_count / article_count * 100,
-                            'total_words': total_source_words,
-                            'avg_words_per_article': total_source_words // max(article_count, 1),
-                            'latest_scrape': latest_date,
-                            'extraction_methods': source_methods,
-                            'content_quality_tiers': source_tiers,
-                            'filename': filename
-                        }
-
-                        # Update global counters
-                        master_index['total_articles'] += article_count
-                        master_index['successful_extractions'] += successful_count
-                        master_index['total_words'] += total_source_words
-                        master_index['total_sources'] += 1
-                        
-                        # Update global method and tier counters
-                        for method, count in source_methods.items():
-                            master_index['extraction_methods'][method] = master_index['extraction_methods'].get(method, 0) + count
-                        
-                        for tier, count in source_tiers.items():
-                            master_index['content_quality_tiers'][tier] = master_index['content_quality_tiers'].get(tier, 0) + count
-                        
-                        all_articles.extend(articles)
-
-                except Exception as e:
-                    logger.warning(f"Error processing {filename} for master index: {e}")
-
-        # Calculate global statistics
-        if master_index['total_articles'] > 0:
-            master_index['extraction_success_rate'] = master_index['successful_extractions'] / master_index['total_articles'] * 100
-            master_index['average_words_per_article'] = master_index['total_words'] // master_index['total_articles']
-
-        # Add top performing sources
-        if master_index['sources']:
-            master_index['top_sources_by_articles'] = sorted(
-                master_index['sources'].items(),
-                key=lambda x: x[1]['article_count'],
-                reverse=True
-            )[:10]
-            
-            master_index['top_sources_by_success_rate'] = sorted(
-                [(name, data) for name, data in master_index['sources'].items() if data['article_count'] >= 5],
-                key=lambda x: x[1]['success_rate'],
-                reverse=True
-            )[:10]
-
-        # Save enhanced master index
-        index_file = os.path.join(base_folder, 'master_index.json')
-        with open(index_file, 'w', encoding='utf-8') as f:
-            json.dump(master_index, f, indent=2, ensure_ascii=False)
-
-        # Create human-readable summary report
-        report_file = os.path.join(base_folder, 'extraction_report.txt')
-        with open(report_file, 'w', encoding='utf-8') as f:
-            f.write("ENHANCED NEWS SCRAPER - EXTRACTION REPORT\n")
-            f.write("=" * 80 + "\n\n")
-            f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-            
-            f.write("OVERALL STATISTICS\n")
-            f.write("-" * 40 + "\n")
-            f.write(f"Total Sources: {master_index['total_sources']}\n")
-            f.write(f"Total Articles: {master_index['total_articles']:,}\n")
-            f.write(f"Successful Extractions: {master_index['successful_extractions']:,}\n")
-            f.write(f"Success Rate: {master_index['extraction_success_rate']:.1f}%\n")
-            f.write(f"Total Words Extracted: {master_index['total_words']:,}\n")
-            f.write(f"Average Words per Article: {master_index['average_words_per_article']}\n\n")
-            
-            f.write("EXTRACTION METHODS\n")
-            f.write("-" * 40 + "\n")
-            for method, count in sorted(master_index['extraction_methods'].items(), key=lambda x: x[1], reverse=True):
-                percentage = count / master_index['total_articles'] * 100
-                f.write(f"{method}: {count} articles ({percentage:.1f}%)\n")
-            f.write("\n")
-            
-            f.write("CONTENT QUALITY TIERS\n")
-            f.write("-" * 40 + "\n")
-            for tier, count in sorted(master_index['content_quality_tiers'].items()):
-                percentage = count / master_index['total_articles'] * 100
-                f.write(f"Tier {tier}: {count} articles ({percentage:.1f}%)\n")
-            f.write("\n")
-            
-            if 'top_sources_by_articles' in master_index:
-                f.write("TOP SOURCES BY ARTICLE COUNT\n")
-                f.write("-" * 40 + "\n")
-                for i, (source, data) in enumerate(master_index['top_sources_by_articles'], 1):
-                    f.write(f"{i:2d}. {source}: {data['article_count']} articles ({data['success_rate']:.1f}% success)\n")
-                f.write("\n")
-            
-            if 'top_sources_by_success_rate' in master_index:
-                f.write("TOP SOURCES BY SUCCESS RATE (min 5 articles)\n")
-                f.write("-" * 40 + "\n")
-                for i, (source, data) in enumerate(master_index['top_sources_by_success_rate'], 1):
-                    f.write(f"{i:2d}. {source}: {data['success_rate']:.1f}% ({data['article_count']} articles)\n")
-
-        logger.info(f"✓ Created enhanced master index and report")
-        logger.info(f"✓ Overall success rate: {master_index['extraction_success_rate']:.1f}%")
-        logger.info(f"✓ {master_index['total_sources']} sources, {master_index['total_articles']:,} articles")
+        master_index = rebuild_master_index(base_folder)
+        if master_index:
+            logger.info(f"✓ Created enhanced master index and report")
+            logger.info(f"✓ Overall success rate: {master_index['extraction_success_rate']:.1f}%")
+            logger.info(f"✓ {master_index['total_sources']} sources, {master_index['total_articles']:,} articles")
 
     except Exception as e:
         logger.error(f"Error creating enhanced master index: {e}")
+
 def main():
     """Enhanced main execution function"""
     print("=" * 80)
@@ -1296,63 +857,123 @@ def main():
             unique_urls.append(url)
             seen_urls.add(url)
 
+    # Resume: URLs already in their source's store were written by an earlier (or crashed) run
+    sources = {url: infer_source_name(url) for url in unique_urls}
+    written = [url for url in unique_urls if is_written(OUTPUT_FOLDER, sources[url], url)]
+    if written:
+        logger.info(f"Skipping {len(written)} URLs already written (last checkpoint: {load_checkpoint()})")
+        written = set(written)
+        unique_urls = [url for url in unique_urls if url not in written]
+    if not unique_urls:
+        print("All URLs were already scraped.")
+        return
+
+    # Catch the master index up with the stores before the workers start writing
+    load_master_index(OUTPUT_FOLDER)
+
     logger.info(f"Loaded {len(unique_urls)} unique URLs to process")
     print(f"Processing {len(unique_urls)} unique URLs...")
     print(f"Output folder: {OUTPUT_FOLDER}/")
     print(f"Target: 100% content extraction success")
     print("-" * 80)
 
-    # Process URLs with enhanced tracking
-    results = {}
+    # Process URLs concurrently, spread across domains; politeness limits apply per domain.
+    # Each article is written to its source's store as soon as it is scraped.
     successful_scrapes = 0
     total_attempts = 0
     failed_urls = []
 
     start_time = time.time()
+    checkpoint = {
+        'started_at': datetime.now().isoformat(),
+        'total_urls': len(unique_urls),
+        'processed': 0,
+        'saved': 0,
+        'failed': 0,
+        'finished': False,
+    }
 
-    for i, url in enumerate(unique_urls, 1):
-        print(f"\n[{i:3d}/{len(unique_urls)}] Processing: {url[:60]}...")
-        total_attempts += 1
+    queue = Queue()
+    for url in interleave_by_domain(unique_urls):
+        queue.put(url)
+    position = {url: i for i, url in enumerate(unique_urls, 1)}
+    results_lock = threading.Lock()
 
+    def worker():
+        nonlocal successful_scrapes, total_attempts
         try:
-            source = infer_source_name(url)
-            article = scrape_article(url, source)
-
-            if article:
-                if source not in results:
-                    results[source] = []
-                results[source].append(article)
-
-                if article.get('extraction_success', False):
-                    successful_scrapes += 1
-                    status = "✅ SUCCESS"
-                else:
-                    status = "⚠️ PARTIAL"
-
-                print(f"         {status}: {article['title'][:50]}...")
-                print(f"         → Method: {article.get('extraction_method', 'standard')}")
-                print(f"         → Words: {article.get('word_count', 0)}")
-                print(f"         → File: {OUTPUT_FOLDER}/{source}.json")
+            # Launch this worker's browser up front so the first rendered fetch does not pay for it
+            try:
+                warm_up()
+            except Exception as e:
+                logger.warning(f"Browser warm-up failed, launching on first use instead: {e}")
 
-            else:
-                failed_urls.append(url)
-                print(f"         ❌ COMPLETE FAILURE")
+            while True:
+                try:
+                    url = queue.get_nowait()
+                except Empty:
+                    return
 
-        except Exception as e:
-            failed_urls.append(url)
-            logger.error(f"Unexpected error processing {url}: {e}")
-            print(f"         ❌ ERROR: {str(e)}")
+                lines = [f"\n[{position[url]:3d}/{len(unique_urls)}] Processing: {url[:60]}..."]
+                article = None
+                source = None
+                try:
+                    source = sources[url]
+                    with domain_slot(url):
+                        article = scrape_article(url, source)
+                except Exception as e:
+                    logger.error(f"Unexpected error processing {url}: {e}")
+                    lines.append(f"         ❌ ERROR: {str(e)}")
 
-    # Save output per source
-    for source, articles in results.items():
-        output_path = os.path.join(OUTPUT_FOLDER, f"{source}.json")
-        try:
-            os.makedirs(OUTPUT_FOLDER, exist_ok=True)
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(articles, f, ensure_ascii=False, indent=2)
-            logger.info(f"Saved {len(articles)} articles for source '{source}' to {output_path}")
-        except Exception as e:
-            logger.error(f"Failed to save output for source {source}: {e}")
+                saved = False
+                # Failed extractions are not stored, so the next run retries them
+                if article and article.get('extraction_success', False):
+                    try:
+                        saved = write_article(OUTPUT_FOLDER, source, article)
+                    except Exception as e:
+                        logger.error(f"Failed to save article {url}: {e}")
+
+                with results_lock:
+                    total_attempts += 1
+                    checkpoint['processed'] = total_attempts
+                    checkpoint['saved'] += int(saved)
+                    if article:
+
+                        if article.get('extraction_success', False):
+                            successful_scrapes += 1
+                            status = "✅ SUCCESS"
+                        else:
+                            status = "⚠️ PARTIAL"
+
+                        lines.append(f"         {status}: {article['title'][:50]}...")
+                        lines.append(f"         → Method: {article.get('extraction_method', 'standard')}")
+                        lines.append(f"         → Words: {article.get('word_count', 0)}")
+                        lines.append(f"         → File: {store_path(OUTPUT_FOLDER, source)}")
+                    else:
+                        failed_urls.append(url)
+                        checkpoint['failed'] = len(failed_urls)
+                        if len(lines) == 1:
+                            lines.append(f"         ❌ COMPLETE FAILURE")
+                    if total_attempts % CHECKPOINT_EVERY == 0:
+                        save_checkpoint(checkpoint)
+                        save_master_index(OUTPUT_FOLDER)
+                    print("\n".join(lines))
+        finally:
+            # Playwright browsers are per thread; shut this worker's down before it exits
+            close_pool()
+
+    workers = [
+        threading.Thread(target=worker, name=f"scraper-{n}")
+        for n in range(max(1, min(MAX_WORKERS, len(unique_urls))))
+    ]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+
+    checkpoint['finished'] = True
+    save_checkpoint(checkpoint)
+    save_master_index(OUTPUT_FOLDER)
 
     # Print summary
     duration = time.time() - start_time
@@ -1,10 +1,15 @@
 #economictimes
-import requests
-from bs4 import BeautifulSoup
+import os
+import sys
+base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+# insert it so that python can resolve the package
+sys.path.insert(0, base_dir)
+from proxy.session import http_get
+from WEB_SCRAPPING.html_parser import make_soup
 
 url = 'https://economictimes.indiatimes.com/prime/economy-and-policy/flames-below-deck-the-silent-threat-lurking-in-cargo-holds/primearticleshow/121891425.cms?source=homepage&medium=prime_exclusives_header&campaign=prime_discovery'
-response = requests.get(url)
-soup = BeautifulSoup(response.content, 'html.parser')
+response = http_get(url)
+soup = make_soup(response.content)
 
 main_content = soup.find("div",class_="clearfix main_container prel prt_cnt layout_mm")
 con=soup.find("div",class_="artText")
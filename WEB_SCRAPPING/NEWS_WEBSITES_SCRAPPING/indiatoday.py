@@ -1,10 +1,15 @@
-from bs4 import BeautifulSoup
-import requests
+import os
+import sys
+base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+# insert it so that python can resolve the package
+sys.path.insert(0, base_dir)
+from proxy.session import http_get
+from WEB_SCRAPPING.html_parser import make_soup
 
 
 def indiatoday_webscrap(url):
-    response = requests.get(url)
-    soup = BeautifulSoup(response.content, 'html.parser')
+    response = http_get(url)
+    soup = make_soup(response.content)
     main_content = soup.find('main', class_='main__content')
     p_tags = main_content.find_all('p')
     h1_tags=main_content.find("h1")
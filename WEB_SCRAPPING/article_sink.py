@@ -0,0 +1,72 @@
+import hashlib
+import json
+import os
+import re
+import threading
+
+from HELPER.jsonl_store import append_items, item_keys, load_index
+from WEB_SCRAPPING.master_index import load_master_index, record_article
+
+# Streaming persistence for scraped articles: each article is appended to
+# <base_folder>/<source>.jsonl (see HELPER.jsonl_store) the moment it is scraped, and run
+# progress is checkpointed atomically, so a crash loses at most the articles in flight.
+CHECKPOINT_FILE = os.path.join("cache", "gnw_checkpoint.json")
+
+_lock = threading.Lock()
+_indexes = {}
+
+
+def safe_source_name(source: str) -> str:
+    return re.sub(r'[<>:"/\\|?*]', '_', source).strip('.')
+
+
+def store_path(base_folder: str, source: str) -> str:
+    return os.path.join(base_folder, f"{safe_source_name(source)}.jsonl")
+
+
+def _index(path: str) -> set:
+    with _lock:
+        if path not in _indexes:
+            _indexes[path] = load_index(path)
+        return _indexes[path]
+
+
+def is_written(base_folder: str, source: str, url: str) -> bool:
+    """True when url is already stored for source (from this run or an earlier one)"""
+    return bool(item_keys(url=url) & _index(store_path(base_folder, source)))
+
+
+def write_article(base_folder: str, source: str, article: dict) -> bool:
+    """Append one article to its source's store; returns False when its URL is already there"""
+    path = store_path(base_folder, source)
+    index = _index(path)
+    url_keys = item_keys(url=article.get('url', ''))
+    load_master_index(base_folder)
+
+    with _lock:
+        if url_keys & index:
+            return False
+        article['content_hash'] = hashlib.md5(article.get('content', '').encode('utf-8')).hexdigest()[:16]
+        append_items(path, [article])
+        index.update(item_keys(article.get('title', ''), article.get('url', '')))
+        record_article(base_folder, os.path.basename(path))
+    return True
+
+
+def load_checkpoint() -> dict:
+    try:
+        with open(CHECKPOINT_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_checkpoint(state: dict) -> None:
+    """Atomically replace the run checkpoint (tmp file + rename)"""
+    os.makedirs(os.path.dirname(CHECKPOINT_FILE), exist_ok=True)
+    tmp_file = f"{CHECKPOINT_FILE}.tmp"
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, CHECKPOINT_FILE)
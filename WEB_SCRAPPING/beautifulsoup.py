@@ -1,13 +1,19 @@
-import requests
-from bs4 import BeautifulSoup
+import os
+import sys
+base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+# insert it so that python can resolve the package
+sys.path.insert(0, base_dir)
+from proxy.session import http_get
+from requests.exceptions import RequestException
+from WEB_SCRAPPING.html_parser import make_soup
 
 def extract_text_from_url(url):
     try:
-        response = requests.get(url)
+        response = http_get(url)
         response.raise_for_status()  # Raise error if the request failed
 
-        # Parse the HTML content using BeautifulSoup
-        soup = BeautifulSoup(response.text, 'html.parser')
+        # Parse the HTML content (lxml, falling back to html.parser)
+        soup = make_soup(response.content)
 
         # Remove script and style elements
         for script_or_style in soup(['script', 'style']):
@@ -18,7 +24,7 @@ def extract_text_from_url(url):
 
         return text
 
-    except requests.exceptions.RequestException as e:
+    except RequestException as e:
         return f"Error fetching the URL: {e}"
 
 # Example usage
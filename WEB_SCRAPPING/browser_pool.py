@@ -0,0 +1,152 @@
+import atexit
+import logging
+import os
+import random
+import threading
+from contextlib import contextmanager
+
+from playwright.sync_api import sync_playwright, Error as PlaywrightError
+
+# Long-lived headless browsers for JS rendering. Playwright's sync API is bound to the thread
+# that started it, so every thread gets its own browser; pages are leased from a warm context
+# that is replaced after MAX_PAGES_PER_CONTEXT pages (or as soon as it stops responding).
+MAX_PAGES_PER_CONTEXT = int(os.getenv("BROWSER_MAX_PAGES_PER_CONTEXT", 50))
+PAGE_TIMEOUT = 45000  # Milliseconds
+BROWSER_ORDER = ("chromium", "firefox", "webkit")  # First one that launches is kept
+
+LAUNCH_ARGS = [
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-blink-features=AutomationControlled',
+    '--disable-extensions',
+    '--disable-plugins',
+    '--disable-images'  # Faster loading
+]
+
+USER_AGENTS = [
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+]
+
+logger = logging.getLogger(__name__)
+
+_local = threading.local()
+
+
+class _ThreadBrowser:
+    """One thread's Playwright driver, browser and current context"""
+
+    def __init__(self):
+        self.playwright = sync_playwright().start()
+        self.browser = None
+        self.context = None
+        self.pages_served = 0
+
+    def _launch(self):
+        last_error = None
+        for name in BROWSER_ORDER:
+            try:
+                browser = getattr(self.playwright, name).launch(headless=True, args=LAUNCH_ARGS)
+                logger.info(f"Browser pool: launched {name} in {threading.current_thread().name}")
+                return browser
+            except PlaywrightError as e:
+                logger.debug(f"Browser {name} failed to launch: {e}")
+                last_error = e
+        raise last_error
+
+    def _new_context(self):
+        context = self.browser.new_context(
+            user_agent=random.choice(USER_AGENTS),
+            viewport={'width': 1920, 'height': 1080},
+            extra_http_headers={
+                'Accept-Language': 'en-US,en;q=0.9',
+                'Accept-Encoding': 'gzip, deflate, br'
+            }
+        )
+        context.set_default_timeout(PAGE_TIMEOUT)
+        return context
+
+    def _close_context(self):
+        if self.context is not None:
+            try:
+                self.context.close()
+            except PlaywrightError:
+                pass
+        self.context = None
+        self.pages_served = 0
+
+    def healthy(self) -> bool:
+        return self.browser is not None and self.browser.is_connected()
+
+    def ensure_ready(self):
+        """Relaunch a dead browser and recycle a context that has served its quota"""
+        if not self.healthy():
+            self.context = None
+            self.pages_served = 0
+            self.browser = self._launch()
+        if self.context is not None and self.pages_served >= MAX_PAGES_PER_CONTEXT:
+            self._close_context()
+        if self.context is None:
+            self.context = self._new_context()
+
+    def new_page(self):
+        self.ensure_ready()
+        try:
+            page = self.context.new_page()
+        except PlaywrightError:
+            # Context went bad (crashed renderer); start a fresh one and retry once
+            self._close_context()
+            self.ensure_ready()
+            page = self.context.new_page()
+        self.pages_served += 1
+        return page
+
+    def close(self):
+        self._close_context()
+        for closer in (getattr(self.browser, "close", None), self.playwright.stop):
+            try:
+                if closer:
+                    closer()
+            except PlaywrightError:
+                pass
+        self.browser = None
+
+
+def _thread_browser() -> _ThreadBrowser:
+    browser = getattr(_local, "browser", None)
+    if browser is None:
+        browser = _ThreadBrowser()
+        _local.browser = browser
+    return browser
+
+
+def warm_up() -> None:
+    """Launch this thread's browser and context ahead of the first fetch"""
+    _thread_browser().ensure_ready()
+
+
+@contextmanager
+def lease_page():
+    """Borrow a fresh page from this thread's warm browser context; it is closed on return"""
+    browser = _thread_browser()
+    page = browser.new_page()
+    try:
+        yield page
+    finally:
+        try:
+            page.close()
+        except PlaywrightError:
+            # The page took its context down with it; replace the context on the next lease
+            browser._close_context()
+
+
+def close_pool() -> None:
+    """Shut down the calling thread's browser (call from worker threads before they exit)"""
+    browser = getattr(_local, "browser", None)
+    if browser is not None:
+        browser.close()
+        _local.browser = None
+
+
+atexit.register(close_pool)
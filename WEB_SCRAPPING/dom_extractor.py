@@ -0,0 +1,154 @@
+import re
+from typing import Optional, Tuple
+
+from bs4 import NavigableString, Tag
+from bs4.element import Comment, Declaration, Doctype, ProcessingInstruction
+
+# Single-pass article body extractor. One post-order walk over the tree computes, for every
+# element, its text length, link text length and comma count from its children; paragraphs
+# then award points to their parent and grandparent (readability style) and the container with
+# the best link-density-adjusted score wins. Only the winner's subtree is walked again for text.
+
+SKIP_TAGS = {
+    "script", "style", "noscript", "template", "iframe", "svg", "form", "button", "select",
+    "nav", "footer", "header", "aside",
+}
+PARAGRAPH_TAGS = {"p", "pre", "blockquote", "td"}
+TEXT_BLOCK_TAGS = ("p", "pre", "blockquote", "h2", "h3", "h4", "li")
+
+POSITIVE_NAMES = re.compile(
+    r"article|story|news|content|text|body|main|post|entry|detail|full|complete|primary|editorial", re.I
+)
+NEGATIVE_NAMES = re.compile(
+    r"nav|sidebar|menu|footer|header|aside|comment|related|share|social|promo|advert|widget|newsletter|subscribe",
+    re.I,
+)
+
+MIN_PARAGRAPH_CHARS = 25  # Shorter paragraphs award no points
+MIN_BLOCK_CHARS = 200  # Less text than this and the page has no usable body
+SIBLING_SCORE_RATIO = 0.2  # Siblings scoring at least this share of the winner are kept with it
+
+_IGNORED_STRINGS = (Comment, Declaration, Doctype, ProcessingInstruction)
+
+
+def _name_weight(element) -> int:
+    names = " ".join(element.get("class") or []) + " " + (element.get("id") or "")
+    if not names.strip():
+        return 0
+    weight = 0
+    if POSITIVE_NAMES.search(names):
+        weight += 25
+    if NEGATIVE_NAMES.search(names):
+        weight -= 25
+    return weight
+
+
+def _walk(root):
+    """
+    Post-order walk computing (text_len, link_len, commas) per element and paragraph points per
+    container. Returns (stats, scores) keyed by id(element); scores holds [element, points].
+    """
+    stats = {}
+    scores = {}
+    stack = [(root, False)]
+    while stack:
+        element, children_done = stack.pop()
+        if not children_done:
+            stack.append((element, True))
+            for child in element.contents:
+                if isinstance(child, Tag) and child.name not in SKIP_TAGS:
+                    stack.append((child, False))
+            continue
+
+        text_len = link_len = commas = 0
+        for child in element.contents:
+            if isinstance(child, NavigableString):
+                if not isinstance(child, _IGNORED_STRINGS):
+                    stripped = child.strip()
+                    text_len += len(stripped)
+                    commas += stripped.count(",")
+            elif isinstance(child, Tag) and child.name not in SKIP_TAGS:
+                child_text, child_links, child_commas = stats[id(child)]
+                text_len += child_text
+                link_len += child_links
+                commas += child_commas
+        if element.name == "a":
+            link_len = text_len
+        stats[id(element)] = (text_len, link_len, commas)
+
+        if element.name in PARAGRAPH_TAGS and text_len >= MIN_PARAGRAPH_CHARS:
+            points = 1 + commas + min(text_len / 100, 3)
+            parent = element.parent
+            if parent is not None:
+                scores.setdefault(id(parent), [parent, _name_weight(parent)])[1] += points
+                grandparent = parent.parent
+                if grandparent is not None:
+                    scores.setdefault(id(grandparent), [grandparent, _name_weight(grandparent)])[1] += points / 2
+
+    return stats, scores
+
+
+def _final_score(element, points, stats) -> float:
+    text_len, link_len, _ = stats.get(id(element), (0, 0, 0))
+    link_density = link_len / text_len if text_len else 1.0
+    return points * (1 - link_density)
+
+
+def _in_skipped(element, stop) -> bool:
+    for parent in element.parents:
+        if parent is stop:
+            return False
+        if parent.name in SKIP_TAGS:
+            return True
+    return False
+
+
+def block_text(element) -> str:
+    """Paragraph-separated text of a block, ignoring nested blocks and skipped subtrees"""
+    parts = []
+    taken = set()
+    for block in element.find_all(TEXT_BLOCK_TAGS):
+        if _in_skipped(block, element):
+            continue
+        if any(id(parent) in taken for parent in block.parents):
+            continue
+        text = block.get_text(" ", strip=True)
+        if text:
+            parts.append(text)
+            taken.add(id(block))
+    return "\n\n".join(parts)
+
+
+def extract_main_block(soup) -> Optional[Tuple[str, float, Tag]]:
+    """Best article block as (text, score, element), or None when the page has no usable body"""
+    root = soup.body or soup
+    stats, scores = _walk(root)
+    if not scores:
+        return None
+
+    best_element, best_score = None, 0.0
+    for element, points in scores.values():
+        score = _final_score(element, points, stats)
+        if score > best_score:
+            best_element, best_score = element, score
+    if best_element is None:
+        return None
+
+    # Article bodies split across sibling containers are kept together
+    blocks = [best_element]
+    parent = best_element.parent
+    if parent is not None:
+        threshold = max(10.0, best_score * SIBLING_SCORE_RATIO)
+        blocks = []
+        for sibling in parent.find_all(recursive=False):
+            if sibling is best_element:
+                blocks.append(sibling)
+            elif id(sibling) in scores and _final_score(sibling, scores[id(sibling)][1], stats) >= threshold:
+                blocks.append(sibling)
+
+    text = "\n\n".join(filter(None, (block_text(block) for block in blocks)))
+    if len(text) < stats[id(best_element)][0] / 2:
+        text = best_element.get_text(" ", strip=True)
+    if len(text) < MIN_BLOCK_CHARS:
+        return None
+    return text, best_score, best_element
@@ -0,0 +1,105 @@
+import codecs
+import re
+import threading
+from functools import lru_cache
+
+try:
+    from charset_normalizer import from_bytes
+except ImportError:  # Older installs only have chardet
+    from_bytes = None
+    import chardet
+
+# HTML decoding pipeline: BOM, the encoding that worked last time for the domain, the declared
+# HTTP charset, <meta charset> in the page head, strict UTF-8, and only then a statistical
+# detector run over a bounded sample of the body.
+META_SCAN_BYTES = 4096  # <meta charset> must appear this early in the page
+DETECT_SAMPLE_BYTES = 32 * 1024  # Bytes handed to the detector
+UNTRUSTED_DECLARED = {"iso-8859-1", "latin-1", "latin1", "windows-1252", "cp1252"}  # HTTP defaults
+
+BOMS = (
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+META_CHARSET_RE = re.compile(rb"""<meta[^>]+charset\s*=\s*["']?\s*([a-zA-Z0-9_.:-]+)""", re.IGNORECASE)
+
+_lock = threading.Lock()
+_domain_encodings = {}
+
+
+def _decode(content: bytes, encoding: str):
+    try:
+        return content.decode(encoding)
+    except (UnicodeDecodeError, LookupError):
+        return None
+
+
+@lru_cache(maxsize=None)
+def _accepts_any_bytes(encoding: str) -> bool:
+    """Single-byte codecs such as cp1252 decode anything, so success proves nothing"""
+    return _decode(bytes(range(256)), encoding) is not None
+
+
+def _bom_encoding(content: bytes):
+    for bom, encoding in BOMS:
+        if content.startswith(bom):
+            return encoding
+    return None
+
+
+def _meta_encoding(content: bytes):
+    match = META_CHARSET_RE.search(content[:META_SCAN_BYTES])
+    return match.group(1).decode("ascii", "ignore").lower() if match else None
+
+
+def _detected_encoding(content: bytes):
+    sample = content[:DETECT_SAMPLE_BYTES]
+    if from_bytes is not None:
+        best = from_bytes(sample).best()
+        return best.encoding if best else None
+    detected = chardet.detect(sample)
+    if detected and detected["encoding"] and detected["confidence"] > 0.5:
+        return detected["encoding"]
+    return None
+
+
+def decode_html(content: bytes, declared: str = None, domain: str = None) -> str:
+    """Decode an HTML body, remembering the encoding that worked for domain"""
+    bom = _bom_encoding(content)
+    if bom:
+        return content.decode(bom, errors="replace")
+
+    with _lock:
+        cached = _domain_encodings.get(domain) if domain else None
+
+    hints = [cached]
+    if declared and declared.lower() not in UNTRUSTED_DECLARED:
+        hints.append(declared)
+    hints.append(_meta_encoding(content))
+    hints = [encoding for encoding in hints if encoding and _decode(b"", encoding) is not None]
+
+    # Strict hints first, then UTF-8, and only then hints that would decode any byte sequence
+    candidates = [encoding for encoding in hints if not _accepts_any_bytes(encoding)]
+    candidates += ["utf-8"] + [encoding for encoding in hints if _accepts_any_bytes(encoding)]
+
+    tried = set()
+    for encoding in candidates:
+        if encoding in tried:
+            continue
+        tried.add(encoding)
+        text = _decode(content, encoding)
+        if text is not None:
+            break
+    else:
+        encoding = _detected_encoding(content) or declared or "utf-8"
+        text = _decode(content, encoding)
+        if text is None:
+            encoding = "utf-8"
+            text = content.decode(encoding, errors="replace")
+
+    if domain and encoding != cached:
+        with _lock:
+            _domain_encodings[domain] = encoding
+    return text
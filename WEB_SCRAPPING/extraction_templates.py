@@ -0,0 +1,93 @@
+import json
+import os
+import re
+import threading
+
+# Per-domain CSS selector of the article body, learned from the block dom_extractor picked on
+# an earlier page of the same domain. Hand-written selectors seed the store.
+TEMPLATE_FILE = os.path.join("cache", "extraction_templates.json")
+TEMPLATE_MIN_CHARS = 300  # A cached selector returning less text than this counts as a miss
+MAX_MISSES = 3  # Consecutive misses before a template is dropped and relearned
+
+SEED_TEMPLATES = {
+    "economictimes.indiatimes.com": "div.artText",
+    "www.indiatoday.in": "main.main__content",
+}
+
+# Class names and ids containing digits are usually generated per build or per article
+_GENERATED_NAME = re.compile(r"\d")
+
+_lock = threading.Lock()
+_templates = None
+_misses = {}
+
+
+def _load():
+    global _templates
+    if _templates is None:
+        try:
+            with open(TEMPLATE_FILE, "r", encoding="utf-8") as f:
+                _templates = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            _templates = dict(SEED_TEMPLATES)
+    return _templates
+
+
+def _save():
+    os.makedirs(os.path.dirname(TEMPLATE_FILE), exist_ok=True)
+    tmp_file = f"{TEMPLATE_FILE}.tmp"
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        json.dump(_templates, f, indent=2)
+    os.replace(tmp_file, TEMPLATE_FILE)
+
+
+def selector_for(element, soup):
+    """Stable CSS selector that picks out element as the first match in soup, or None"""
+    element_id = element.get("id")
+    classes = [name for name in element.get("class") or [] if not _GENERATED_NAME.search(name)]
+
+    candidates = []
+    if element_id and not _GENERATED_NAME.search(element_id):
+        candidates.append(f"{element.name}#{element_id}")
+    if classes:
+        candidates.append(element.name + "".join(f".{name}" for name in classes))
+
+    for selector in candidates:
+        try:
+            if soup.select_one(selector) is element:
+                return selector
+        except Exception:
+            continue
+    return None
+
+
+def get_template(domain: str):
+    with _lock:
+        return _load().get(domain)
+
+
+def remember_template(domain: str, selector: str) -> None:
+    """
+    Learn selector for a domain without a template. A domain that has one keeps it (and its
+    miss count) until template_miss drops it, so a miss followed by a DOM pass cannot flip it.
+    """
+    with _lock:
+        templates = _load()
+        if domain not in templates:
+            templates[domain] = selector
+            _save()
+
+
+def template_hit(domain: str) -> None:
+    with _lock:
+        _misses.pop(domain, None)
+
+
+def template_miss(domain: str) -> None:
+    """Count a miss; after MAX_MISSES in a row the domain goes back to the full cascade"""
+    with _lock:
+        _misses[domain] = _misses.get(domain, 0) + 1
+        if _misses[domain] >= MAX_MISSES:
+            _misses.pop(domain)
+            if _load().pop(domain, None) is not None:
+                _save()
@@ -0,0 +1,52 @@
+import json
+import os
+import threading
+import time
+
+# Per-domain memory of which fetch tier produced a usable article body
+TIER_FILE = os.path.join("cache", "fetch_tiers.json")
+TIER_TTL = float(os.getenv("FETCH_TIER_TTL", 7 * 24 * 3600))  # Re-probe a domain after this many seconds
+
+STATIC = "static"
+RENDER = "render"
+
+_lock = threading.Lock()
+_tiers = None
+
+
+def _load():
+    global _tiers
+    if _tiers is None:
+        try:
+            with open(TIER_FILE, "r", encoding="utf-8") as f:
+                _tiers = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            _tiers = {}
+    return _tiers
+
+
+def _save():
+    os.makedirs(os.path.dirname(TIER_FILE), exist_ok=True)
+    tmp_file = f"{TIER_FILE}.tmp"
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        json.dump(_tiers, f, indent=2)
+    os.replace(tmp_file, TIER_FILE)
+
+
+def get_tier(domain: str):
+    """Tier remembered for a domain (STATIC or RENDER), None when unknown or stale"""
+    with _lock:
+        entry = _load().get(domain)
+    if not entry or time.time() - entry.get("checked", 0) > TIER_TTL:
+        return None
+    return entry.get("tier")
+
+
+def remember_tier(domain: str, tier: str) -> None:
+    with _lock:
+        tiers = _load()
+        entry = tiers.get(domain)
+        if entry and entry.get("tier") == tier and time.time() - entry.get("checked", 0) <= TIER_TTL:
+            return
+        tiers[domain] = {"tier": tier, "checked": time.time()}
+        _save()
@@ -1,10 +1,10 @@
-import requests
 import os
 import json
 from requests.exceptions import Timeout, RequestException
 from dotenv import load_dotenv
 from urllib.parse import urlencode
 from HELPER.cse_date_formatter import extract_date_and_description
+from proxy.session import http_get
 
 load_dotenv()
 CSE_API_KEY = os.getenv("GOOGLE_API_KEY")
@@ -23,7 +23,7 @@ def google_cse_search(query: str) -> list:
     }
 
     try:
-        response = requests.get(url, params=params, timeout=10)
+        response = http_get(url, params=params, timeout=10)
         data = response.json()
     except Timeout:
         # If the request times out, return an empty list
@@ -0,0 +1,28 @@
+import os
+
+from bs4 import BeautifulSoup, FeatureNotFound
+
+# Parser backends in order of preference; lxml builds the tree several times faster than
+# html.parser, which is kept as the fallback for markup lxml rejects (or when it is missing).
+PARSER_ORDER = tuple(os.getenv("HTML_PARSERS", "lxml,html.parser").split(","))
+FALLBACK_PARSER = "html.parser"
+
+_unavailable = set()
+
+
+def make_soup(markup, parser: str = None) -> BeautifulSoup:
+    """BeautifulSoup tree built with the first parser in PARSER_ORDER that handles the markup"""
+    for name in ((parser,) if parser else PARSER_ORDER):
+        if name in _unavailable:
+            continue
+        try:
+            soup = BeautifulSoup(markup, name)
+        except FeatureNotFound:
+            _unavailable.add(name)
+            continue
+        except Exception:
+            continue
+        # An empty tree from non-empty markup means the backend gave up on it
+        if soup.contents or not markup:
+            return soup
+    return BeautifulSoup(markup, FALLBACK_PARSER)
@@ -0,0 +1,304 @@
+import glob
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+
+from HELPER.jsonl_store import iter_items
+
+# data/master_index.json and data/extraction_report.txt, maintained from per-article deltas as
+# articles are saved. Global totals are sums over the per-store entries, so an update costs
+# O(sources) instead of re-reading the corpus; rebuild_master_index() recomputes from scratch.
+# Each entry records the byte offset (and inode) up to which its store has been counted, so
+# appends made behind the index's back (RSS polls, a crash before the index was saved) are
+# caught up by reading only the new tail. Only a store replaced by a rewrite is read in full.
+# The entries, offsets included, are kept in master_index.state.json; the published index and
+# report carry the counters only.
+INDEX_NAME = 'master_index.json'
+STATE_NAME = 'master_index.state.json'
+REPORT_NAME = 'extraction_report.txt'
+SOURCE_COUNTERS = ('article_count', 'successful_extractions', 'total_words', 'extraction_methods',
+                   'content_quality_tiers', 'latest_scrape')
+STORE_STATE = ('store_bytes', 'store_inode')
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()  # Guards _indexes
+_load_lock = threading.Lock()  # Serialises the (possibly slow) first load per folder
+_indexes = {}  # base_folder -> {"sources": {filename: {...}}, "dirty": bool}
+
+
+def _empty_source(filename: str) -> dict:
+    return {
+        'store_bytes': 0,
+        'store_inode': None,
+        'article_count': 0,
+        'successful_extractions': 0,
+        'total_words': 0,
+        'latest_scrape': '',
+        'extraction_methods': {},
+        'content_quality_tiers': {},
+        'filename': filename,
+    }
+
+
+def _apply(entry: dict, article: dict) -> None:
+    """Add one article's delta to a source entry"""
+    entry['article_count'] += 1
+    entry['successful_extractions'] += int(bool(article.get('extraction_success', False)))
+    entry['total_words'] += article.get('word_count', 0) or 0
+
+    method = article.get('extraction_method', 'standard')
+    entry['extraction_methods'][method] = entry['extraction_methods'].get(method, 0) + 1
+    tier = str(article.get('content_quality_tier', 'unknown'))
+    entry['content_quality_tiers'][tier] = entry['content_quality_tiers'].get(tier, 0) + 1
+
+    scraped_at = article.get('scraped_at') or ''
+    if scraped_at > entry['latest_scrape']:
+        entry['latest_scrape'] = scraped_at
+
+
+def _store_files(base_folder: str) -> list:
+    paths = glob.glob(os.path.join(base_folder, '*.jsonl')) + glob.glob(os.path.join(base_folder, '*.json'))
+    return sorted(path for path in paths if not os.path.basename(path).startswith('master_index'))
+
+
+def _read_tail(entry: dict, path: str) -> None:
+    """Count the complete lines appended to a .jsonl store since entry's offset"""
+    with open(path, 'rb') as f:
+        f.seek(entry['store_bytes'])
+        tail = f.read()
+    end = tail.rfind(b'\n') + 1  # A line still being written is left for the next sync
+    for line in tail[:end].splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            article = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(article, dict):
+            _apply(entry, article)
+    entry['store_bytes'] += end
+
+
+def _sync_store(entry, path: str):
+    """
+    Bring entry up to date with the store at path: unchanged stores cost one stat, appended
+    .jsonl stores only their tail, and rewritten or legacy .json stores a full read.
+    Returns the entry, or None when the store cannot be read.
+    """
+    filename = os.path.basename(path)
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+
+    if entry is not None and entry.get('store_inode') == stat.st_ino:
+        if entry['store_bytes'] == stat.st_size:
+            return entry
+        if filename.endswith('.jsonl') and entry['store_bytes'] < stat.st_size:
+            try:
+                _read_tail(entry, path)
+                return entry
+            except OSError as e:
+                logger.warning(f"Error processing {filename} for master index: {e}")
+                return None
+
+    entry = _empty_source(filename)
+    entry['store_inode'] = stat.st_ino
+    try:
+        if filename.endswith('.jsonl'):
+            _read_tail(entry, path)
+        else:
+            for article in iter_items(path):
+                if isinstance(article, dict):
+                    _apply(entry, article)
+            entry['store_bytes'] = stat.st_size
+    except Exception as e:
+        logger.warning(f"Error processing {filename} for master index: {e}")
+        return None
+    return entry
+
+
+def _scan(base_folder: str, sources: dict = None) -> dict:
+    """Entries for every store, keyed by filename, reusing and extending those in sources"""
+    sources = sources or {}
+    scanned = {}
+    for path in _store_files(base_folder):
+        filename = os.path.basename(path)
+        entry = _sync_store(sources.get(filename), path)
+        if entry is not None:
+            scanned[filename] = entry
+    return scanned
+
+
+def _read_state(base_folder: str) -> dict:
+    """Per-store entries saved by the last save_master_index; {} when missing or unreadable"""
+    try:
+        with open(os.path.join(base_folder, STATE_NAME), 'r', encoding='utf-8') as f:
+            sources = json.load(f).get('sources', {})
+        return {
+            entry['filename']: {key: entry[key] for key in SOURCE_COUNTERS + STORE_STATE + ('filename',)}
+            for entry in sources.values()
+        }
+    except (FileNotFoundError, json.JSONDecodeError, KeyError, TypeError, AttributeError):
+        return {}
+
+
+def _write_json(path: str, data) -> None:
+    tmp_file = f"{path}.tmp"
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_file, path)
+
+
+def load_master_index(base_folder: str) -> None:
+    """
+    Load the index for base_folder and catch it up with the stores on disk. Call it before
+    taking any write lock: the first call may read store tails (or, once, whole stores).
+    """
+    with _load_lock:
+        if base_folder in _indexes:
+            return
+        counters = _read_state(base_folder)
+        sources = _scan(base_folder, {name: dict(entry) for name, entry in counters.items()})
+        with _lock:
+            _indexes[base_folder] = {'sources': sources, 'dirty': sources != counters}
+
+
+def record_article(base_folder: str, filename: str) -> None:
+    """
+    Fold what was just appended to base_folder/filename into the index (written out by
+    save_master_index). Only the store's new tail is read.
+    """
+    load_master_index(base_folder)
+    with _lock:
+        state = _indexes[base_folder]
+        entry = _sync_store(state['sources'].get(filename), os.path.join(base_folder, filename))
+        if entry is not None:
+            state['sources'][filename] = entry
+            state['dirty'] = True
+
+
+def build_master_index(sources: dict) -> dict:
+    """Full master index document (global totals, rates, top sources) from per-store counters"""
+    sources = {name: entry for name, entry in sources.items() if entry['article_count']}
+    master_index = {
+        'created_at': datetime.now().isoformat(),
+        'total_sources': len(sources),
+        'total_articles': 0,
+        'successful_extractions': 0,
+        'extraction_success_rate': 0.0,
+        'total_words': 0,
+        'average_words_per_article': 0,
+        'extraction_methods': {},
+        'content_quality_tiers': {},
+        'sources': {}
+    }
+
+    for name, counters in sources.items():
+        entry = {key: value for key, value in counters.items() if key not in STORE_STATE}
+        entry['success_rate'] = entry['successful_extractions'] / max(entry['article_count'], 1) * 100
+        entry['avg_words_per_article'] = entry['total_words'] // max(entry['article_count'], 1)
+        master_index['sources'][name] = entry
+
+        master_index['total_articles'] += entry['article_count']
+        master_index['successful_extractions'] += entry['successful_extractions']
+        master_index['total_words'] += entry['total_words']
+        for method, count in entry['extraction_methods'].items():
+            master_index['extraction_methods'][method] = master_index['extraction_methods'].get(method, 0) + count
+        for tier, count in entry['content_quality_tiers'].items():
+            master_index['content_quality_tiers'][tier] = master_index['content_quality_tiers'].get(tier, 0) + count
+
+    if master_index['total_articles'] > 0:
+        master_index['extraction_success_rate'] = master_index['successful_extractions'] / master_index['total_articles'] * 100
+        master_index['average_words_per_article'] = master_index['total_words'] // master_index['total_articles']
+
+    if master_index['sources']:
+        master_index['top_sources_by_articles'] = sorted(
+            master_index['sources'].items(),
+            key=lambda x: x[1]['article_count'],
+            reverse=True
+        )[:10]
+
+        master_index['top_sources_by_success_rate'] = sorted(
+            [(name, data) for name, data in master_index['sources'].items() if data['article_count'] >= 5],
+            key=lambda x: x[1]['success_rate'],
+            reverse=True
+        )[:10]
+
+    return master_index
+
+
+def _write_report(master_index: dict, report_file: str) -> None:
+    """Human-readable summary report"""
+    with open(report_file, 'w', encoding='utf-8') as f:
+        f.write("ENHANCED NEWS SCRAPER - EXTRACTION REPORT\n")
+        f.write("=" * 80 + "\n\n")
+        f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+
+        f.write("OVERALL STATISTICS\n")
+        f.write("-" * 40 + "\n")
+        f.write(f"Total Sources: {master_index['total_sources']}\n")
+        f.write(f"Total Articles: {master_index['total_articles']:,}\n")
+        f.write(f"Successful Extractions: {master_index['successful_extractions']:,}\n")
+        f.write(f"Success Rate: {master_index['extraction_success_rate']:.1f}%\n")
+        f.write(f"Total Words Extracted: {master_index['total_words']:,}\n")
+        f.write(f"Average Words per Article: {master_index['average_words_per_article']}\n\n")
+
+        f.write("EXTRACTION METHODS\n")
+        f.write("-" * 40 + "\n")
+        for method, count in sorted(master_index['extraction_methods'].items(), key=lambda x: x[1], reverse=True):
+            percentage = count / master_index['total_articles'] * 100
+            f.write(f"{method}: {count} articles ({percentage:.1f}%)\n")
+        f.write("\n")
+
+        f.write("CONTENT QUALITY TIERS\n")
+        f.write("-" * 40 + "\n")
+        for tier, count in sorted(master_index['content_quality_tiers'].items()):
+            percentage = count / master_index['total_articles'] * 100
+            f.write(f"Tier {tier}: {count} articles ({percentage:.1f}%)\n")
+        f.write("\n")
+
+        if 'top_sources_by_articles' in master_index:
+            f.write("TOP SOURCES BY ARTICLE COUNT\n")
+            f.write("-" * 40 + "\n")
+            for i, (source, data) in enumerate(master_index['top_sources_by_articles'], 1):
+                f.write(f"{i:2d}. {source}: {data['article_count']} articles ({data['success_rate']:.1f}% success)\n")
+            f.write("\n")
+
+        if 'top_sources_by_success_rate' in master_index:
+            f.write("TOP SOURCES BY SUCCESS RATE (min 5 articles)\n")
+            f.write("-" * 40 + "\n")
+            for i, (source, data) in enumerate(master_index['top_sources_by_success_rate'], 1):
+                f.write(f"{i:2d}. {source}: {data['success_rate']:.1f}% ({data['article_count']} articles)\n")
+
+
+def save_master_index(base_folder: str, force: bool = False):
+    """Write master_index.json, its state file and extraction_report.txt if anything changed since the last save"""
+    load_master_index(base_folder)
+    with _lock:
+        state = _indexes[base_folder]
+        if not (state['dirty'] or force):
+            return None
+        master_index = build_master_index(state['sources'])
+        # Snapshot the entries: record_article keeps advancing them once the lock is released
+        store_state = json.loads(json.dumps({'sources': state['sources']}))
+        state['dirty'] = False
+
+    os.makedirs(base_folder, exist_ok=True)
+    _write_json(os.path.join(base_folder, INDEX_NAME), master_index)
+    _write_json(os.path.join(base_folder, STATE_NAME), store_state)
+    _write_report(master_index, os.path.join(base_folder, REPORT_NAME))
+    return master_index
+
+
+def rebuild_master_index(base_folder: str):
+    """Recompute the index from every store in base_folder (on demand only)"""
+    with _load_lock:
+        sources = _scan(base_folder)
+        with _lock:
+            _indexes[base_folder] = {'sources': sources, 'dirty': True}
+    return save_master_index(base_folder)
@@ -0,0 +1,74 @@
+import os
+import random
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+# Per-domain politeness for the article scraper: at most MAX_PER_DOMAIN requests in flight per
+# domain, request starts on a domain spaced by a random delay, and backoffs (403/429, errors)
+# that pause only the domain that caused them.
+MAX_PER_DOMAIN = int(os.getenv("SCRAPER_MAX_PER_DOMAIN", 2))
+
+_lock = threading.Lock()
+_domains = {}
+
+
+def domain_of(url: str) -> str:
+    return urlparse(url).netloc.lower()
+
+
+def _state(domain: str) -> dict:
+    with _lock:
+        if domain not in _domains:
+            _domains[domain] = {
+                "slots": threading.BoundedSemaphore(MAX_PER_DOMAIN),
+                "next_request": 0.0,
+                "paused_until": 0.0,
+            }
+        return _domains[domain]
+
+
+def interleave_by_domain(urls) -> list:
+    """Round-robin URLs across domains so workers spread over as many domains as possible"""
+    by_domain = OrderedDict()
+    for url in urls:
+        by_domain.setdefault(domain_of(url), []).append(url)
+
+    ordered = []
+    while by_domain:
+        for domain in list(by_domain):
+            ordered.append(by_domain[domain].pop(0))
+            if not by_domain[domain]:
+                del by_domain[domain]
+    return ordered
+
+
+@contextmanager
+def domain_slot(url: str):
+    """Hold one of the domain's MAX_PER_DOMAIN concurrency slots"""
+    slots = _state(domain_of(url))["slots"]
+    slots.acquire()
+    try:
+        yield
+    finally:
+        slots.release()
+
+
+def wait_turn(url: str, delay=(1, 3)) -> None:
+    """Block until the domain may be hit again, then book the next request delay seconds later"""
+    state = _state(domain_of(url))
+    with _lock:
+        now = time.monotonic()
+        start = max(now, state["next_request"], state["paused_until"])
+        state["next_request"] = start + random.uniform(*delay)
+    if start > now:
+        time.sleep(start - now)
+
+
+def backoff(url: str, seconds: float) -> None:
+    """Pause every request to this URL's domain for the given number of seconds"""
+    state = _state(domain_of(url))
+    with _lock:
+        state["paused_until"] = max(state["paused_until"], time.monotonic() + seconds)
@@ -0,0 +1,127 @@
+import re
+import string
+
+# Garbage / quality scoring for scraped text fragments. The garbage patterns are combined into
+# one compiled regex, and every quality feature comes from C-level string operations over the
+# fragment (no per-character Python loops), so scoring thousands of fragments per page is cheap.
+# score_fragments/filter_fragments score a page's candidates in one batch, repeats only once.
+
+CONTENT_QUALITY_THRESHOLD = 0.3  # Lower threshold for aggressive extraction
+
+# Expanded garbage patterns with more lenient detection
+GARBAGE_PATTERNS = [
+    r"^\s*(javascript|error|404|page not found|loading|redirect)\s*$",
+    r"^\s*(advertisement|sponsored content|ads by|click here)\s*$",
+    r"^\s*(\w{1,2}|\d+)\s*$",
+    r"^\s*(home|menu|search|login|signup|next|previous|back|share|like|tweet)\s*$",
+    r"^\s*(cookie|privacy policy|terms of service|subscribe|newsletter)\s*$",
+    r"^\s*[\W\d\s]*$",
+    r"^\s*(comments?|reply|show more|load more|continue reading)\s*$",
+    r"^\s*(follow us|social media|connect with us)\s*$",
+]
+GARBAGE_RE = re.compile("|".join(f"(?:{pattern})" for pattern in GARBAGE_PATTERNS), re.IGNORECASE)
+
+NAV_KEYWORDS = ['click', 'tap', 'swipe', 'menu', 'button', 'link', 'navigation', 'sidebar']
+
+SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+_ASCII_LETTERS = string.ascii_letters.encode("ascii")
+PUNCTUATION = ".!?,:;"
+
+_stopwords = None
+
+
+def _english_stopwords() -> set:
+    """NLTK English stopwords, loaded on first use (after GNW has downloaded the corpus)"""
+    global _stopwords
+    if _stopwords is None:
+        try:
+            from nltk.corpus import stopwords
+            _stopwords = set(stopwords.words('english'))
+        except Exception:
+            _stopwords = set()
+    return _stopwords
+
+
+def calculate_text_quality(text: str) -> float:
+    """Calculate text quality score based on various metrics"""
+    if not text or len(text.strip()) < 10:
+        return 0.0
+
+    words = text.strip().lower().split()
+    return _quality(text, words)
+
+
+def _quality(text: str, words: list) -> float:
+    if len(words) < 3:
+        return 0.1
+
+    # Character composition
+    # ASCII letters survive a latin-1 encode unchanged, so deleting them from the bytes counts them
+    latin = text.encode("latin-1", "ignore")
+    alpha_chars = len(latin) - len(latin.translate(None, _ASCII_LETTERS))
+    total_chars = len(text) - text.count(' ')
+    alpha_ratio = alpha_chars / max(total_chars, 1)
+
+    # Average word length
+    avg_word_length = sum(map(len, words)) / len(words)
+
+    # Sentence structure
+    sentence_count = sum(1 for sentence in SENTENCE_SPLIT_RE.split(text) if len(sentence.strip()) > 10)
+
+    # Common English words
+    stopwords = _english_stopwords()
+    english_words = sum(map(stopwords.__contains__, words)) if stopwords else 0
+    english_ratio = english_words / len(words)
+
+    # Punctuation ratio
+    punct_count = sum(map(text.count, PUNCTUATION))
+    punct_ratio = punct_count / len(words)
+
+    return (
+        alpha_ratio * 0.3 +
+        min(avg_word_length / 6, 1) * 0.2 +
+        min(sentence_count / 3, 1) * 0.2 +
+        min(english_ratio * 2, 1) * 0.2 +
+        min(punct_ratio * 10, 1) * 0.1
+    )
+
+
+def score_fragment(text: str):
+    """(is_garbage, quality) for one fragment; quality is 0.0 for fragments rejected early"""
+    if not text or len(text.strip()) < 10:
+        return True, 0.0
+
+    text_clean = text.strip().lower()
+    if GARBAGE_RE.match(text_clean):
+        return True, 0.0
+
+    words = text_clean.split()
+    quality = _quality(text, words)
+    if quality < CONTENT_QUALITY_THRESHOLD:
+        return True, quality
+
+    # Navigation/UI wording
+    nav_ratio = sum(1 for keyword in NAV_KEYWORDS if keyword in text_clean) / max(len(words), 1)
+    return nav_ratio > 0.3, quality
+
+
+def is_garbage(text: str) -> bool:
+    """Enhanced garbage detection with quality scoring"""
+    return score_fragment(text)[0]
+
+
+def score_fragments(texts) -> list:
+    """score_fragment for many fragments at once; repeated fragments are scored once"""
+    scored = {}
+    results = []
+    for text in texts:
+        if text not in scored:
+            scored[text] = score_fragment(text)
+        results.append(scored[text])
+    return results
+
+
+def filter_fragments(texts) -> list:
+    """The fragments that are not garbage, in their original order"""
+    texts = list(texts)
+    return [text for text, (garbage, _) in zip(texts, score_fragments(texts)) if not garbage]
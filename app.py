@@ -7,39 +7,23 @@ import sys
 import os
 
 from HELPER.key_extractor import extract_keywords
-from DB_RECTIFIER.news_matcher_and_added import NEWS_SCORE, add_news_in_db
+from DB_RECTIFIER.news_matcher_and_added import NEWS_SCORE, add_news_in_db, embed_news
 from WEB_SCRAPPING.GNW import infer_source_name
-from rss_functions.ALL_RSS import all_rss
-from CORE.websites import rss_websites, rss_functions
-from proxy.oxylab import proxy_content
+from CORE.websites import build_feed_jobs
+from CORE.ingestion import ingest_feeds, format_ingestion_report
 from HELPER.news_classifier import classify_news  # Correct import
+from HELPER.jsonl_store import read_items, update_items
+from HELPER.embeddings import EMBED_BATCH_SIZE
  # Instance of classifier
 
-def get_source(full_source):
-    parts = full_source.split("_")
-    source = parts[0]
-    source_category = parts[1] if len(parts) > 1 else "general"
-    return full_source, source, source_category
-
-# Optional fallback RSS function if source not found
-def fallback_rss_handler(rss_url, json_file, csv_file, source, category):
-    logging.warning(f"Using fallback RSS handler for source: {source}")
-    return all_rss(rss_url, json_file, csv_file, source, category)
-
 def run_rss_ingestion():
     logging.info("Starting RSS ingestion...")
-    for key, value in rss_websites.items():
-        full_name, source, source_category = get_source(key)
-        json_file = os.path.join("data", f"{full_name}.json")
-        csv_file = os.path.join("log", f"{full_name}.csv")
-
-        rss_url = proxy_content(value)
+    jobs = build_feed_jobs()
 
-        rss_func = rss_functions.get(full_name, fallback_rss_handler)
-        try:
-            rss_func(rss_url, json_file, csv_file, source, source_category)
-        except Exception as e:
-            logging.error(f"Error processing {key}: {e}")
+    start_time = time.time()
+    report = ingest_feeds(jobs)
+    print(format_ingestion_report(report, time.time() - start_time))
+    return report
 
 def run_gn():
     print("Running GN.py (Google Discovery metadata search)...")
@@ -66,16 +50,24 @@ def run_gnw():
     print("Running GNW.py (Full article scraper)...")
     subprocess.run([sys.executable, "WEB_SCRAPPING/GN.py"], check=True)
 
+def article_files():
+    # Article stores are append-only .jsonl files; older outputs may still be whole-file .json
+    return [
+        path for path in glob.glob("data/*.json") + glob.glob("data/*.jsonl")
+        if not os.path.basename(path).startswith("master_index")
+    ]
+
 def extract_keywords_post_gnw():
     print("Extracting keywords from full news content post-GNW.py scraping...")
-    data_files = glob.glob("data/*.json")
-
-    for filepath in data_files:
-        with open(filepath, "r", encoding="utf-8") as f:
-            articles = json.load(f)
+    data_files = article_files()
 
+    def add_keywords(articles):
+        # Articles keep the keywords of an earlier run, so only new ones are extracted and
+        # stores without new articles are left untouched
         updated = False
         for article in articles:
+            if article.get("keywords"):
+                continue
             full_news = article.get("content") or article.get("full_news") or article.get("full_content", "")
             if not full_news:
                 continue
@@ -83,34 +75,25 @@ def extract_keywords_post_gnw():
             if keywords:
                 article["keywords"] = keywords
                 updated = True
+        return updated
 
-        if updated:
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(articles, f, indent=2, ensure_ascii=False)
+    rewritten = sum(update_items(filepath, add_keywords) for filepath in data_files)
+    print(f"Keywords added in {rewritten} of {len(data_files)} stores")
 
     print("Keyword extraction completed and saved.")
 
-def insert_articles_to_db():
-    print("Inserting articles into database with deduplication...")
-    data_files = glob.glob("data/*.json")
-    total_inserted = 0
-
-    for filepath in data_files:
-        with open(filepath, "r", encoding="utf-8") as f:
-            articles = json.load(f)
-
-        for article in articles:
+def pending_db_articles():
+    """(article, full_news, article_category) for every stored article that has content"""
+    pending = []
+    for filepath in article_files():
+        for article in read_items(filepath):
             full_news = article.get("content") or article.get("full_news") or article.get("full_content", "")
             if not full_news:
                 continue
 
-            title = article.get("title", "")
-            description = article.get("description", "")
-            source = article.get("source")
-
-            if not source:
+            if not article.get("source"):
                 url = article.get("url") or article.get("link")
-                source = infer_source_name(url) if url else "Unknown"
+                article["source"] = infer_source_name(url) if url else "Unknown"
 
             category = article.get("category")
             subcategory = article.get("subcategory")
@@ -119,7 +102,26 @@ def insert_articles_to_db():
             if category:
                 article_category.append({"category": category, "subcategory": subcategory})
 
-            similar_id, somewhat_similar_id, vector_embeddings = NEWS_SCORE(article)
+            pending.append((article, full_news, article_category))
+    return pending
+
+def insert_articles_to_db(batch_size=EMBED_BATCH_SIZE):
+    print("Inserting articles into database with deduplication...")
+    pending = pending_db_articles()
+    total_inserted = 0
+    embed_seconds = 0.0
+    start_time = time.time()
+
+    # Articles are embedded a batch at a time and each batch is matched/inserted in order,
+    # so later articles still see the ones inserted before them
+    for offset in range(0, len(pending), batch_size):
+        batch = pending[offset:offset + batch_size]
+        embed_start = time.time()
+        embeddings = embed_news([article for article, _, _ in batch], batch_size=batch_size)
+        embed_seconds += time.time() - embed_start
+
+        for (article, full_news, article_category), vector_embeddings in zip(batch, embeddings):
+            similar_id, somewhat_similar_id, vector_embeddings = NEWS_SCORE(article, vector_embeddings)
 
             add_news_in_db(
                 article,
@@ -131,24 +133,22 @@ def insert_articles_to_db():
             )
             total_inserted += 1
 
+    elapsed = time.time() - start_time
+    if pending:
+        print(
+            f"Embedded {len(pending)} articles in {embed_seconds:.1f}s "
+            f"({len(pending) / max(embed_seconds, 1e-9):.1f} items/sec, batch size {batch_size})"
+        )
+        print(f"Matched and inserted {total_inserted} articles at {total_inserted / max(elapsed, 1e-9):.1f} items/sec")
     print(f"Inserted {total_inserted} articles into the database.")
 
 def app():
+    # Each stage finishes (subprocesses are waited on) before the next starts, so no gaps are needed
     run_rss_ingestion()
-    time.sleep(2)
-
     run_gn()
-    time.sleep(2)
-
     classify_metadata_categories()
-    time.sleep(2)
-
     run_gnw()
-    time.sleep(2)
-
     extract_keywords_post_gnw()
-    time.sleep(2)
-
     insert_articles_to_db()
     print("Pipeline complete.")
 
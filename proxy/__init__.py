@@ -1 +1,2 @@
-from .oxylab import proxy_content
\ No newline at end of file
+from .oxylab import proxy_content, NOT_MODIFIED
+from .session import get_session, http_get
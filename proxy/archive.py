@@ -0,0 +1,148 @@
+import glob
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+
+# Raw-response archive: every fetched body is stored as one gzip member appended to the current
+# segment file. A segment is rotated once it passes SEGMENT_MAX_BYTES and the oldest segments are
+# deleted once the archive passes ARCHIVE_MAX_BYTES. Each member holds a JSON header line
+# ({"url", "time", "status", "sha256", "length"}) followed by the raw body bytes.
+ARCHIVE_DIR = os.getenv("HTML_ARCHIVE_DIR", "html_logs")
+SEGMENT_MAX_BYTES = int(os.getenv("HTML_ARCHIVE_SEGMENT_BYTES", 16 * 1024 * 1024))
+ARCHIVE_MAX_BYTES = int(os.getenv("HTML_ARCHIVE_MAX_BYTES", 256 * 1024 * 1024))
+COMPRESSION_LEVEL = 6
+
+# url -> [sha256, segment] of the last body archived for it, kept as an append-only journal of
+# [url, sha256, segment] lines that is compacted whenever segments are deleted
+LATEST_FILE = os.path.join(ARCHIVE_DIR, "latest.jsonl")
+LEGACY_LATEST_FILE = os.path.join(ARCHIVE_DIR, "latest.json")
+
+_lock = threading.Lock()
+_latest = None
+_journal_lines = 0
+_segment = None
+
+
+def _segments() -> list:
+    """Segment files, oldest first"""
+    return sorted(glob.glob(os.path.join(ARCHIVE_DIR, "segment-*.gz")))
+
+
+def _load_latest() -> dict:
+    global _latest, _journal_lines
+    if _latest is not None:
+        return _latest
+
+    _latest = {}
+    try:
+        with open(LATEST_FILE, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    url, digest, segment = json.loads(line)
+                except (json.JSONDecodeError, ValueError):
+                    continue  # Torn last line after a crash
+                _latest[url] = [digest, segment]
+                _journal_lines += 1
+    except FileNotFoundError:
+        try:
+            with open(LEGACY_LATEST_FILE, "r", encoding="utf-8") as f:
+                _latest = json.load(f)
+            _compact_latest()
+            os.remove(LEGACY_LATEST_FILE)
+        except (FileNotFoundError, json.JSONDecodeError):
+            pass
+    return _latest
+
+
+def _record_latest(url: str, digest: str, segment: str) -> None:
+    global _journal_lines
+    _latest[url] = [digest, segment]
+    with open(LATEST_FILE, "a", encoding="utf-8") as f:
+        f.write(json.dumps([url, digest, segment]) + "\n")
+    _journal_lines += 1
+
+
+def _compact_latest() -> None:
+    """Rewrite the journal with one line per url"""
+    global _journal_lines
+    tmp_file = f"{LATEST_FILE}.tmp"
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        for url, (digest, segment) in _latest.items():
+            f.write(json.dumps([url, digest, segment]) + "\n")
+    os.replace(tmp_file, LATEST_FILE)
+    _journal_lines = len(_latest)
+
+
+def _current_segment() -> str:
+    global _segment
+    if _segment is None:
+        existing = _segments()
+        _segment = existing[-1] if existing else None
+    if _segment is None or (os.path.exists(_segment) and os.path.getsize(_segment) >= SEGMENT_MAX_BYTES):
+        _segment = os.path.join(ARCHIVE_DIR, f"segment-{time.time_ns():020d}-{os.getpid()}.gz")
+    return _segment
+
+
+def _enforce_size_cap() -> None:
+    segments = _segments()
+    sizes = {path: os.path.getsize(path) for path in segments}
+    total = sum(sizes.values())
+    removed = set()
+    for path in segments:
+        if total <= ARCHIVE_MAX_BYTES or path == _segment:
+            break
+        os.remove(path)
+        removed.add(path)
+        total -= sizes[path]
+
+    if removed:
+        # Bodies in deleted segments are gone, so their urls no longer have an archived copy
+        remaining = set(segments) - removed
+        for url in [url for url, (_, segment) in _latest.items() if segment not in remaining]:
+            del _latest[url]
+    if removed or _journal_lines > 2 * len(_latest) + 1000:
+        _compact_latest()
+
+
+def archive_response(url: str, content: bytes, status: int = 200) -> bool:
+    """
+    Store a raw response body without decoding it. Returns False when the body is identical
+    to the last copy archived for url, in which case nothing is written.
+    """
+    digest = hashlib.sha256(content).hexdigest()
+    with _lock:
+        os.makedirs(ARCHIVE_DIR, exist_ok=True)
+        latest = _load_latest()
+        previous = latest.get(url)
+        if previous and previous[0] == digest and os.path.exists(previous[1]):
+            return False
+
+        header = json.dumps({
+            "url": url,
+            "time": time.time(),
+            "status": status,
+            "sha256": digest,
+            "length": len(content),
+        }).encode("utf-8")
+        segment = _current_segment()
+        with open(segment, "ab") as f:
+            f.write(gzip.compress(header + b"\n" + content, COMPRESSION_LEVEL))
+
+        _record_latest(url, digest, segment)
+        _enforce_size_cap()
+    return True
+
+
+def iter_archive(segment: str = None):
+    """Yield (header, body) for every response in one segment, or in the whole archive"""
+    for path in [segment] if segment else _segments():
+        with gzip.open(path, "rb") as f:
+            while True:
+                line = f.readline()
+                if not line:
+                    break
+                header = json.loads(line)
+                yield header, f.read(header["length"])
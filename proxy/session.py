@@ -0,0 +1,163 @@
+import ipaddress
+import os
+import random
+import socket
+import threading
+import time
+from collections import OrderedDict
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NameResolutionError, NewConnectionError
+from urllib3.util.retry import Retry
+
+# Connection pooling
+POOL_CONNECTIONS = int(os.getenv("HTTP_POOL_CONNECTIONS", 32))  # Number of hosts kept in the pool
+POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", 8))  # Keep-alive connections kept per host
+
+# Retries with jittered exponential backoff
+MAX_RETRIES = int(os.getenv("HTTP_MAX_RETRIES", 3))
+BACKOFF_FACTOR = float(os.getenv("HTTP_BACKOFF_FACTOR", 0.5))
+BACKOFF_JITTER = float(os.getenv("HTTP_BACKOFF_JITTER", 0.5))
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+DEFAULT_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", 30))
+DNS_CACHE_TTL = float(os.getenv("DNS_CACHE_TTL", 300))  # Seconds a resolved address is reused
+DNS_CACHE_SIZE = int(os.getenv("DNS_CACHE_SIZE", 512))  # Hosts kept, least recently used dropped first
+
+_session_lock = threading.Lock()
+_sessions = {}
+
+_dns_lock = threading.Lock()
+_dns_cache = OrderedDict()  # (host, port) -> (expires_at, address)
+
+
+class JitteredRetry(Retry):
+    """urllib3 Retry that adds random jitter on top of the exponential backoff"""
+
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        if backoff <= 0:
+            return backoff
+        return backoff + random.uniform(0, BACKOFF_JITTER)
+
+
+def _is_ip(host: str) -> bool:
+    try:
+        ipaddress.ip_address(host)
+        return True
+    except ValueError:
+        return False
+
+
+def _resolve(host: str, port: int) -> str:
+    """Address for host, reused for DNS_CACHE_TTL seconds"""
+    key = (host, port)
+    now = time.monotonic()
+    with _dns_lock:
+        cached = _dns_cache.get(key)
+        if cached and cached[0] > now:
+            _dns_cache.move_to_end(key)
+            return cached[1]
+
+    address = socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM)[0][4][0]
+    with _dns_lock:
+        _dns_cache[key] = (now + DNS_CACHE_TTL, address)
+        _dns_cache.move_to_end(key)
+        while len(_dns_cache) > DNS_CACHE_SIZE:
+            _dns_cache.popitem(last=False)
+    return address
+
+
+def _forget_address(host: str, port: int) -> None:
+    with _dns_lock:
+        _dns_cache.pop((host, port), None)
+
+
+class _CachedDNSMixin:
+    """urllib3 connection that connects to a cached address for its host (TLS still uses the name)"""
+
+    def _new_conn(self):
+        hostname = self._dns_host
+        if DNS_CACHE_TTL <= 0 or _is_ip(hostname):
+            return super()._new_conn()
+        try:
+            address = _resolve(hostname, self.port)
+        except socket.gaierror as e:
+            raise NameResolutionError(self.host, self, e) from e
+
+        self._dns_host = address
+        try:
+            return super()._new_conn()
+        except (NewConnectionError, ConnectTimeoutError):
+            # The cached address may be stale; resolve again on the next attempt
+            _forget_address(hostname, self.port)
+            raise
+        finally:
+            self._dns_host = hostname
+
+
+class _CachedDNSHTTPConnection(_CachedDNSMixin, HTTPConnection):
+    pass
+
+
+class _CachedDNSHTTPSConnection(_CachedDNSMixin, HTTPSConnection):
+    pass
+
+
+class _CachedDNSHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _CachedDNSHTTPConnection
+
+
+class _CachedDNSHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _CachedDNSHTTPSConnection
+
+
+class CachedDNSAdapter(HTTPAdapter):
+    """HTTPAdapter whose direct connections reuse resolved addresses (the socket module is untouched)"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _CachedDNSHTTPConnectionPool,
+            "https": _CachedDNSHTTPSConnectionPool,
+        }
+
+
+def _build_session(retry: bool) -> requests.Session:
+    session = requests.Session()
+    retries = JitteredRetry(
+        total=MAX_RETRIES if retry else 0,
+        backoff_factor=BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUS_CODES if retry else (),
+        allowed_methods=frozenset(["GET", "HEAD"]),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = CachedDNSAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, max_retries=retries)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"Connection": "keep-alive"})
+    return session
+
+
+def get_session(retry: bool = True) -> requests.Session:
+    """
+    Shared keep-alive session with per-host connection pools.
+
+    Pass retry=False for callers that run their own retry loop. Per-request headers should be
+    passed to get() rather than set on the session, since the session is shared across threads.
+    """
+    with _session_lock:
+        if retry not in _sessions:
+            _sessions[retry] = _build_session(retry)
+        return _sessions[retry]
+
+
+def http_get(url: str, retry: bool = True, **kwargs) -> requests.Response:
+    """GET through the shared session, applying DEFAULT_TIMEOUT when none is given"""
+    if kwargs.get("timeout") is None:
+        kwargs["timeout"] = DEFAULT_TIMEOUT
+    return get_session(retry).get(url, **kwargs)
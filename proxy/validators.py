@@ -0,0 +1,66 @@
+import json
+import os
+import threading
+
+# Persistent ETag / Last-Modified validators, keyed by feed URL
+VALIDATOR_FILE = os.path.join("cache", "feed_validators.json")
+
+_lock = threading.Lock()
+_validators = None
+
+
+def _load():
+    global _validators
+    if _validators is None:
+        try:
+            with open(VALIDATOR_FILE, "r", encoding="utf-8") as f:
+                _validators = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            _validators = {}
+    return _validators
+
+
+def _save():
+    os.makedirs(os.path.dirname(VALIDATOR_FILE), exist_ok=True)
+    tmp_file = f"{VALIDATOR_FILE}.tmp"
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        json.dump(_validators, f, indent=2)
+    os.replace(tmp_file, VALIDATOR_FILE)
+
+
+def conditional_headers(url: str) -> dict:
+    """Build If-None-Match / If-Modified-Since headers from the stored validators"""
+    with _lock:
+        stored = _load().get(url, {})
+
+    headers = {}
+    if stored.get("etag"):
+        headers["If-None-Match"] = stored["etag"]
+    if stored.get("last_modified"):
+        headers["If-Modified-Since"] = stored["last_modified"]
+    return headers
+
+
+def store_validators(url: str, response_headers) -> None:
+    """Remember the validators a 200 response came back with"""
+    etag = response_headers.get("ETag")
+    last_modified = response_headers.get("Last-Modified")
+
+    with _lock:
+        validators = _load()
+        if not etag and not last_modified:
+            if validators.pop(url, None) is not None:
+                _save()
+            return
+
+        entry = {"etag": etag, "last_modified": last_modified}
+        if validators.get(url) != entry:
+            validators[url] = entry
+            _save()
+
+
+def forget_validators(url: str) -> None:
+    """Drop stored validators so the next poll downloads the feed in full"""
+    with _lock:
+        if _load().pop(url, None) is not None:
+            _save()
@@ -1,9 +1,11 @@
-import feedparser
 import json
 import csv
 import os
 from datetime import datetime
-from HELPER.dateformatter import standardize_pub_dates
+from HELPER.dateformatter import normalize_pub_dates, format_pub_date
+from HELPER.jsonl_store import jsonl_path, load_index, item_keys, append_items
+from HELPER import dedup_index
+from .stream_parser import iter_entries
 
 def ensure_directories():
     os.makedirs("log", exist_ok=True)
@@ -20,54 +22,92 @@ def log_statistics(new_count: int, duplicate_count: int, csv_file: str):
             writer.writerow(["Timestamp", "New Titles", "Duplicate Titles", "Total Processed"])
         writer.writerow([timestamp, new_count, duplicate_count, new_count + duplicate_count])
 
-def all_rss(rss_url: str, json_file: str, csv_file: str, source: str, source_category: str) -> str:
+# Incremental parsing stops after this many consecutive entries that are already known
+INCREMENTAL_STOP_AFTER = 5
+
+# Default mapping of stored item fields onto feedparser entry keys
+DEFAULT_FIELDS = {
+    "title": "title",
+    "link": "link",
+    "description": "description",
+}
+
+def all_rss(rss_url: str, json_file: str, csv_file: str, source: str, source_category: str,
+            language: str = None, language_field: str = "language", fields: dict = None,
+            date_field: str = "published", incremental: bool = True,
+            stop_after: int = INCREMENTAL_STOP_AFTER) -> str:
+    """
+    Generic RSS handler used for every feed in CORE/feeds.json.
+
+    language keeps only entries whose language_field equals it, fields maps stored item
+    keys onto entry keys, and date_field names the entry key holding the publish date.
+    With incremental on, the feed is parsed lazily and reading stops after stop_after
+    consecutive entries that are already stored (here or through another feed), so a pinned
+    or reordered story does not hide newer ones; turn it off for feeds not ordered newest first.
+    """
     ensure_directories()
+    fields = {**DEFAULT_FIELDS, **(fields or {})}
 
-    # Load existing data
-    existing_titles = set()
-    if os.path.exists(json_file):
-        try:
-            with open(json_file, "r", encoding="utf-8") as f:
-                existing_data = json.load(f)
-                existing_titles = {item["title"] for item in existing_data}
-        except (json.JSONDecodeError, FileNotFoundError):
-            existing_data = []
-    else:
-        existing_data = []
+    # Load the compact title/URL index instead of the whole history
+    store_file = jsonl_path(json_file)
+    seen_keys = load_index(store_file)
+    # Cross-feed claims are recorded under the store name, as when the index is seeded
+    feed_name = os.path.splitext(os.path.basename(json_file))[0]
 
     # Parse RSS feed
-    feed = feedparser.parse(rss_url)
+    entries = iter_entries(rss_url)
 
     new_items = []
+    raw_dates = []
     new_count = 0
     duplicate_count = 0
+    cross_feed_count = 0
+    known_run = 0
+
+    try:
+        for entry in entries:
+            if language and entry.get(language_field, "") != language:
+                continue
+
+            item = {key: entry.get(entry_key, "") for key, entry_key in fields.items()}
+            keys = item_keys(item.get("title", ""), item.get("link", ""))
+            if seen_keys & keys:
+                duplicate_count += 1
+                known_run += 1
+            elif not dedup_index.claim(item.get("link", ""), item.get("title", ""), feed_name):
+                # Already ingested through another feed (syndicated story)
+                duplicate_count += 1
+                cross_feed_count += 1
+                known_run += 1
+            else:
+                known_run = 0
+                new_count += 1
+                item["pubDate"] = None  # Filled in below, one batch per feed
+                raw_dates.append(entry.get(date_field, ""))
+                item["source"] = source
+                item["source_category"] = source_category
+                new_items.append(item)
+                seen_keys.update(keys)
+
+            if incremental and known_run >= stop_after:
+                # Newest first: everything after this run was seen on an earlier poll
+                break
+
+        for item, pub_date in zip(new_items, normalize_pub_dates(raw_dates, source=source)):
+            item["pubDate"] = format_pub_date(pub_date)
 
-    for entry in feed.entries:
-        title = entry.get("title", "")
-        if title in existing_titles:
-            duplicate_count += 1
-        else:
-            new_count += 1
-            item = {
-                "title": title,
-                "link": entry.get("link", ""),
-                "description": entry.get("description", ""),
-                "pubDate": standardize_pub_dates([entry.get("published", "")]),
-                "source": source,
-                "source_category": source_category
-            }
-            new_items.append(item)
-            existing_titles.add(title)
-
-    all_items = existing_data + new_items
-
-    with open(json_file, "w", encoding="utf-8") as f:
-        json.dump(all_items, f, indent=4, ensure_ascii=False)
+        append_items(store_file, new_items)
+    except Exception:
+        # Not stored, so the refetch must not see these items as claimed by another feed
+        for item in new_items:
+            dedup_index.release(item.get("link", ""), item.get("title", ""), feed_name)
+        raise
 
     log_statistics(new_count, duplicate_count, csv_file)
 
-    print(f"{source_category} Processing complete: {new_count} new titles, {duplicate_count} duplicates")
-    print(f"Data saved to: {json_file}")
-    print(f"Log saved to: log/{csv_file}")
+    print(f"{source_category} Processing complete: {new_count} new titles, {duplicate_count} duplicates "
+          f"({cross_feed_count} seen in other feeds)")
+    print(f"Data saved to: {store_file}")
+    print(f"Log saved to: {csv_file}")
 
-    return json.dumps(all_items, indent=4, ensure_ascii=False)
+    return json.dumps(new_items, indent=4, ensure_ascii=False)
@@ -1,26 +1 @@
-from .economictimes import economictimes_rss
-from .prnews_manufacturing import prnewswire_rss
-from .ndtv_latest import ndtvprofit_latest_rss
-from .ndtv_trending import ndtvprofit_trending_rss
-from .ndtv_top_stories import ndtv_top_stories_rss
-from .money_control import moneycontrol_rss
-from .livemint import livemint_rss
-from .thehindu_industry import thehindu_Industry_rss
-from .thehindu_Economy import thehindu_Economy_rss
-from .thehindu_markets import thehindu_markets_rss
-from .thehindu_business import thehindu_business_rss
-from .znews import zeenews_rss
-from .hindustantimes import hindustantimes_rss
-from .indiatoday import indiatoday_rss
-from .indiatvnews import indiatvnews_rss
-from .timesofindia_business import timesofindia_business_rss
-from .timesofindia_topstories import timesofindia_topstories_rss
-from .cnbc import cnbc_rss
-from .etnownews_latest import etnow_latest_rss
-from .etnownews_standard import etnow_standard_rss
-from .etnownews_markets import etnow_markets_rss
-from .indianexpress import indianexpress_rss
-from .economictimes_default import economictimes_default_rss
-from .economictimes_markets import economictimes_markets_rss
-from .economictimes_industry import economictimes_industry_rss
-from .ALL_RSS import all_rss
\ No newline at end of file
+from .ALL_RSS import all_rss, log_statistics
@@ -0,0 +1,90 @@
+import xml.etree.ElementTree as ET
+
+import feedparser
+
+# Streaming RSS/Atom reader: entries are parsed one at a time from the feed body, so a caller
+# that stops iterating (after a run of already-stored entries) never parses the rest of the feed.
+
+CHUNK_SIZE = 16 * 1024  # Bytes handed to the XML parser at a time
+
+ENTRY_TAGS = {"item", "entry"}
+
+# Element names mapped onto the feedparser entry keys the handlers already use
+ENTRY_KEYS = {
+    "pubdate": "published",
+    "guid": "id",
+    "summary": "description",
+}
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1].lower()
+
+
+def _element_text(element) -> str:
+    return "".join(element.itertext()).strip()
+
+
+# Which link wins when an item has several: Atom alternate href, then RSS <link> text, then any
+# other href (rel="self", "enclosure", ...)
+ALTERNATE_LINK, TEXT_LINK, OTHER_LINK = 0, 1, 2
+
+
+def _entry_from_element(element) -> dict:
+    entry = {}
+    link_rank = None
+    for child in element:
+        name = _local_name(child.tag)
+        if name == "link":
+            if child.get("href"):
+                link = child.get("href")
+                rank = ALTERNATE_LINK if child.get("rel", "alternate") == "alternate" else OTHER_LINK
+            else:
+                link = _element_text(child)
+                rank = TEXT_LINK
+            if link and (link_rank is None or rank < link_rank):
+                entry["link"], link_rank = link, rank
+            continue
+        key = ENTRY_KEYS.get(name, name)
+        if key not in entry:
+            entry[key] = _element_text(child)
+
+    # Fallbacks for feeds that only carry dc:date / Atom updated or content
+    entry.setdefault("published", entry.get("date") or entry.get("updated", ""))
+    entry.setdefault("description", entry.get("content", ""))
+    if not entry.get("link") and entry.get("id", "").startswith("http"):
+        entry["link"] = entry["id"]
+    return entry
+
+
+def _entry_key(entry) -> tuple:
+    return entry.get("link", ""), entry.get("title", "")
+
+
+def iter_entries(content, chunk_size: int = CHUNK_SIZE):
+    """
+    Lazily yield feed entries (dicts keyed like feedparser entries) in document order.
+
+    Feeds that are not well-formed XML (HTML entities, broken markup) fall back to
+    feedparser, skipping any entries that were already yielded before the error.
+    """
+    if not isinstance(content, bytes):
+        yield from feedparser.parse(content).entries
+        return
+
+    parser = ET.XMLPullParser(events=("end",))
+    yielded = set()
+    try:
+        for offset in range(0, len(content), chunk_size):
+            parser.feed(content[offset:offset + chunk_size])
+            for _, element in parser.read_events():
+                if _local_name(element.tag) in ENTRY_TAGS:
+                    entry = _entry_from_element(element)
+                    element.clear()
+                    yielded.add(_entry_key(entry))
+                    yield entry
+        parser.close()
+    except ET.ParseError:
+        for entry in feedparser.parse(content).entries:
+            if _entry_key(entry) not in yielded:
+                yield entry
@@ -0,0 +1,41 @@
+import feedparser
+
+from rss_functions.stream_parser import iter_entries
+
+SELF_LINK_FEED = b"""<?xml version="1.0"?>
+<rss version="2.0" xmlns:atom="http://www.w3.org/2005/Atom">
+  <channel>
+    <title>Example</title>
+    <item>
+      <title>Story B</title>
+      <atom:link rel="self" href="https://ex.com/self"/>
+      <link>https://ex.com/b</link>
+    </item>
+    <item>
+      <title>Story C</title>
+      <link>https://ex.com/c</link>
+      <atom:link rel="self" href="https://ex.com/self"/>
+    </item>
+  </channel>
+</rss>
+"""
+
+ATOM_FEED = b"""<?xml version="1.0"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <entry>
+    <title>Story D</title>
+    <link rel="self" href="https://ex.com/feed/d"/>
+    <link href="https://ex.com/d"/>
+  </entry>
+</feed>
+"""
+
+
+def test_item_self_link_does_not_replace_rss_link():
+    links = [entry["link"] for entry in iter_entries(SELF_LINK_FEED)]
+    assert links == ["https://ex.com/b", "https://ex.com/c"]
+    assert links == [entry.link for entry in feedparser.parse(SELF_LINK_FEED).entries]
+
+
+def test_atom_alternate_link_preferred_over_self():
+    assert [entry["link"] for entry in iter_entries(ATOM_FEED)] == ["https://ex.com/d"]